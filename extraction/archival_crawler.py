@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
+import re
 from collections import defaultdict, deque
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Deque, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse
 
@@ -14,18 +15,17 @@ from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from .browser import BrowserConfig, BrowserSession
 from .io_utils import RunPaths, relative_artifact_path, save_text, write_json
+from .keywords import LOGIN_PATH_RE, keyword_pattern
 from .login_flow import perform_login
 from .page_utils import safe_goto
 
-LOGIN_PATH_HINTS = ("login", "signin", "sign-in", "sign_in")
-LOGOUT_PATH_HINTS = ("logout", "log-out", "signout", "signout", "sign-out", "logoff")
+LOGOUT_PATH_HINTS = ("logout", "log-out", "signout", "sign-out", "logoff")
 REGISTER_PATH_HINTS = (
     "register",
     "signup",
     "sign-up",
     "create-account",
     "create_account",
-    "sign-up",
 )
 SKIP_EXTENSIONS = (
     ".png",
@@ -47,7 +47,7 @@ SKIP_EXTENSIONS = (
     ".webm",
     ".webp",
 )
-ALLOWED_SCHEMES = {"http", "https"}
+ALLOWED_SCHEMES = frozenset({"http", "https"})
 INFRA_DOMAIN_BLOCKLIST: Set[str] = {
     "google.com",
     "google.ch",
@@ -94,7 +94,15 @@ class PageRecord:
     error: Optional[str] = None
 
     def to_dict(self) -> Dict[str, object]:
-        return asdict(self)
+        return {
+            "url": self.url,
+            "original_url": self.original_url,
+            "status_code": self.status_code,
+            "content_path": self.content_path,
+            "screenshot_path": self.screenshot_path,
+            "depth": self.depth,
+            "error": self.error,
+        }
 
 
 @dataclass(slots=True)
@@ -121,7 +129,7 @@ def _origin_host(url: str) -> str:
 
 def _extract_host(url: str) -> str:
     parsed = urlparse(url)
-    return (parsed.hostname or "").lower().lstrip("www.")
+    return (parsed.hostname or "").lower().removeprefix("www.")
 
 
 def _registrable_domain(url: str) -> str:
@@ -148,7 +156,7 @@ def _normalize_url(candidate: str) -> Optional[str]:
         return None
     if parsed.scheme.lower() not in ALLOWED_SCHEMES:
         return None
-    host = (parsed.hostname or "").lower().lstrip("www.")
+    host = (parsed.hostname or "").lower().removeprefix("www.")
     if not host:
         return None
     port = f":{parsed.port}" if parsed.port else ""
@@ -166,21 +174,25 @@ def _path_and_query(url: str) -> Tuple[str, str]:
     return path, query
 
 
-def _contains_hint(url: str, hints: Tuple[str, ...]) -> bool:
+_LOGOUT_PATH_RE = keyword_pattern(LOGOUT_PATH_HINTS)
+_REGISTER_PATH_RE = keyword_pattern(REGISTER_PATH_HINTS)
+
+
+def _contains_hint(url: str, pattern: re.Pattern[str]) -> bool:
     path, query = _path_and_query(url)
-    return any(hint and (hint in path or hint in query) for hint in hints)
+    return bool(pattern.search(path) or pattern.search(query))
 
 
 def _looks_like_login(url: str) -> bool:
-    return _contains_hint(url, LOGIN_PATH_HINTS)
+    return _contains_hint(url, LOGIN_PATH_RE)
 
 
 def _looks_like_logout(url: str) -> bool:
-    return _contains_hint(url, LOGOUT_PATH_HINTS)
+    return _contains_hint(url, _LOGOUT_PATH_RE)
 
 
 def _looks_like_register(url: str) -> bool:
-    return _contains_hint(url, REGISTER_PATH_HINTS)
+    return _contains_hint(url, _REGISTER_PATH_RE)
 
 
 def _is_static_asset(url: str) -> bool:
@@ -13,6 +13,7 @@ from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 from .automation import click_keywords
+from .browser import mutation_count, wait_for_click_effect
 from .page_utils import safe_goto
 
 FormT = TypeVar("FormT")
@@ -112,9 +113,11 @@ def discover_form_with_navigation(
                 candidate.label,
                 candidate.score,
             )
+            pre_url = page.url
+            before_click = mutation_count(page)
             if not candidate.safe_click(logger):
                 continue
-            page.wait_for_timeout(800)
+            wait_for_click_effect(page, pre_url, before_click)
             form, meta = detect_form(page)
             if form and is_valid_form(form, meta):
                 return form, meta
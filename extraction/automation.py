@@ -5,12 +5,15 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional, Sequence
 
 from playwright.sync_api import ElementHandle, Page
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
+from .browser import mutation_count, wait_for_click_effect
+from .keywords import keyword_pattern
+
 EMAIL_SELECTORS = [
     "input[type='email']",
     "input[name*='email' i]",
@@ -180,20 +183,84 @@ def click_keywords(
     logger: Optional[logging.Logger] = None,
 ) -> int:
     log = _resolve_logger(logger)
+    remaining = list(dict.fromkeys(keywords))
     clicks = 0
-    for keyword in keywords:
-        if clicks >= max_clicks:
+    while remaining and clicks < max_clicks:
+        log.debug("Attempting to click one of %s", remaining)
+        pre_url = page.url
+        before_click = mutation_count(page)
+        keyword = click_by_pattern(
+            page, keyword_pattern(remaining), remaining, logger=log
+        )
+        if keyword is None:
+            log.debug("None of the remaining keywords are clickable")
             break
-        log.debug("Attempting to click keyword '%s'", keyword)
-        if click_by_text(page, keyword, logger=log):
-            clicks += 1
-            page.wait_for_timeout(1200)
-            log.debug("Clicked keyword '%s'", keyword)
-        else:
-            log.debug("Keyword '%s' not clickable on current page", keyword)
+        clicks += 1
+        wait_for_click_effect(page, pre_url, before_click, timeout_ms=1200)
+        log.debug("Clicked keyword '%s'", keyword)
+        remaining.remove(keyword)
     return clicks
 
 
+PATTERN_CLICK_TIMEOUT_MS = 3000
+# Text sources a role locator's accessible name is usually built from, kept
+# apart so a keyword cannot straddle two of them.
+_ACCESSIBLE_TEXTS_JS = """
+(els) => els.map((el) => [
+    el.innerText || '',
+    el.getAttribute('aria-label') || '',
+    el.getAttribute('title') || '',
+    typeof el.value === 'string' ? el.value : '',
+])
+"""
+
+
+def click_by_pattern(
+    page: Page,
+    pattern: re.Pattern[str],
+    keyword_order: Sequence[str],
+    *,
+    logger: Optional[logging.Logger] = None,
+) -> Optional[str]:
+    """Click the match for the highest-priority keyword in one DOM pass.
+
+    Visible buttons and links are enumerated together with a single read of
+    their text, aria-label, title and value, then visible text matches if no
+    control matched. Returns the keyword clicked, or None when no candidate
+    can be attributed to a keyword or the click failed.
+    """
+    log = _resolve_logger(logger)
+    unranked = len(keyword_order)
+    ranks = {keyword.lower(): rank for rank, keyword in enumerate(keyword_order)}
+    controls = page.get_by_role("button", name=pattern).or_(
+        page.get_by_role("link", name=pattern)
+    )
+    try:
+        for candidates in (controls, page.get_by_text(pattern)):
+            locator = candidates.locator("visible=true")
+            names = locator.evaluate_all(_ACCESSIBLE_TEXTS_JS)
+            best_index, best_rank = 0, unranked
+            for index, parts in enumerate(names):
+                lowered = "\0".join(parts).lower()
+                rank = min(
+                    (rank for keyword, rank in ranks.items() if keyword in lowered),
+                    default=unranked,
+                )
+                if rank < best_rank:
+                    best_index, best_rank = index, rank
+            if best_rank == unranked:
+                continue
+            locator.nth(best_index).click(timeout=PATTERN_CLICK_TIMEOUT_MS)
+            keyword = keyword_order[best_rank]
+            log.debug("Clicked element %d for keyword '%s'", best_index, keyword)
+            return keyword
+    except PlaywrightError as exc:
+        log.debug("Click matching '%s' failed: %s", pattern.pattern, exc)
+        return None
+    log.debug("No element matching '%s' found to click", pattern.pattern)
+    return None
+
+
 def click_by_text(
     page: Page, text: str, *, logger: Optional[logging.Logger] = None
 ) -> bool:
@@ -214,13 +281,18 @@ def click_by_text(
     return False
 
 
+ERROR_BANNER_KEYWORDS = ("error", "invalid", "failed", "incorrect")
+ERROR_BANNER_PATTERNS = tuple(
+    (keyword, re.compile(keyword, re.IGNORECASE)) for keyword in ERROR_BANNER_KEYWORDS
+)
+
+
 def detect_error_banner(
     page: Page, *, logger: Optional[logging.Logger] = None
 ) -> Optional[str]:
     log = _resolve_logger(logger)
-    error_keywords = ["error", "invalid", "failed", "incorrect"]
-    for keyword in error_keywords:
-        locator = page.get_by_text(re.compile(keyword, re.IGNORECASE))
+    for keyword, pattern in ERROR_BANNER_PATTERNS:
+        locator = page.get_by_text(pattern)
         try:
             if locator.count() > 0:
                 text = locator.first.inner_text(timeout=500)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Literal, Optional, Tuple
 
 from playwright.sync_api import (
     Browser,
@@ -13,6 +13,122 @@ from playwright.sync_api import (
     Playwright,
     sync_playwright,
 )
+from playwright.sync_api import Error as PlaywrightError
+
+
+# Installed by sessions that opt in through BrowserConfig.init_scripts (the
+# deep-dive probe) so callers can wait for "the DOM changed since count N"
+# via window.__asMutationCount instead of sleeping a fixed time. The count and
+# token are read-only, non-enumerable properties so the page cannot reset the
+# revision that keyed caches rely on.
+MUTATION_COUNTER_SCRIPT = """
+(() => {
+    if ('__asMutationCount' in window) {
+        return;
+    }
+    let count = 0;
+    Object.defineProperty(window, '__asMutationCount', { get: () => count });
+    Object.defineProperty(window, '__asDocToken', {
+        value: Math.random().toString(36).slice(2),
+    });
+    const bump = () => {
+        count += 1;
+    };
+    new MutationObserver(bump).observe(document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true,
+    });
+    document.addEventListener('input', bump, true);
+    document.addEventListener('change', bump, true);
+})();
+"""
+
+# Changes whenever the document is replaced or mutated, so results tied to
+# element handles can be reused while it holds; null without the counter.
+# Script writes to .value leave no mutation record, so the current input
+# values are hashed in at read time.
+DOCUMENT_REVISION_JS = """
+() => {
+    if (window.__asMutationCount === undefined) {
+        return null;
+    }
+    let hash = 0x811c9dc5;
+    for (const field of document.querySelectorAll('input, textarea')) {
+        const value = field.value || '';
+        for (let idx = 0; idx < value.length; idx += 1) {
+            hash = Math.imul(hash ^ value.charCodeAt(idx), 0x01000193);
+        }
+        hash = Math.imul(hash ^ 0x1f, 0x01000193);
+    }
+    return [
+        window.__asDocToken,
+        window.__asMutationCount,
+        (hash >>> 0).toString(36),
+    ].join(':');
+}
+"""
+
+
+# Resolves once the counter has moved past ``since`` and then stayed put for
+# ``quietMs``, i.e. whatever the click opened has finished rendering.
+_DOM_SETTLED_JS = """
+({ since, quietMs }) => {
+    const count = window.__asMutationCount || 0;
+    if (count <= since) {
+        return false;
+    }
+    const now = performance.now();
+    const last = window.__asSettle;
+    if (!last || last.count !== count) {
+        window.__asSettle = { count, at: now };
+        return false;
+    }
+    return now - last.at >= quietMs;
+}
+"""
+DOM_SETTLE_QUIET_MS = 40
+
+
+def mutation_count(target) -> int:
+    try:
+        return int(target.evaluate("() => window.__asMutationCount || 0"))
+    except PlaywrightError:
+        return 0
+
+
+def wait_for_dom_settled(page: Page, since: int, timeout_ms: int = 800) -> bool:
+    """Wait until the DOM changed after count ``since`` and went quiet."""
+    try:
+        page.wait_for_function(
+            _DOM_SETTLED_JS,
+            arg={"since": since, "quietMs": DOM_SETTLE_QUIET_MS},
+            timeout=timeout_ms,
+        )
+        return True
+    except PlaywrightError:
+        return False
+
+
+def wait_for_click_effect(
+    page: Page, pre_url: str, since: int, timeout_ms: int = 800
+) -> None:
+    """Wait for the next document if a click navigated, else for the DOM to settle."""
+    if page.url == pre_url:
+        wait_for_dom_settled(page, since, timeout_ms)
+        return
+    try:
+        page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
+    except PlaywrightError:
+        pass
+
+
+def document_revision(target) -> Optional[str]:
+    try:
+        return target.evaluate(DOCUMENT_REVISION_JS)
+    except PlaywrightError:
+        return None
 
 
 @dataclass(slots=True)
@@ -22,6 +138,10 @@ class BrowserConfig:
     navigation_timeout_ms: int = 45000
     viewport_width: int = 1280
     viewport_height: int = 720
+    # Capture a screenshot for every probe view, not only those with indicators.
+    always_screenshot: bool = False
+    # Extra scripts installed once per context, ahead of every document.
+    init_scripts: Tuple[str, ...] = ()
 
 
 class BrowserSession:
@@ -39,16 +159,33 @@ class BrowserSession:
         self._browser = self._playwright.chromium.launch(
             headless=self.config.headless, slow_mo=self.config.slow_mo
         )
+        self._open_context()
+        return self
+
+    def _open_context(self) -> None:
         self._context = self._browser.new_context(
             viewport={
                 "width": self.config.viewport_width,
                 "height": self.config.viewport_height,
             }
         )
+        for script in self.config.init_scripts:
+            self._context.add_init_script(script)
         self._page = self._context.new_page()
         self._page.set_default_timeout(self.config.navigation_timeout_ms)
         self._page.set_default_navigation_timeout(self.config.navigation_timeout_ms)
-        return self
+
+    def reset_context(self) -> None:
+        """Swap in a fresh context (no cookies or storage) on the running browser."""
+        if not self._browser:
+            raise RuntimeError("BrowserSession is not started")
+        if self._context:
+            try:
+                self._context.close()
+            except PlaywrightError:
+                pass
+        self._page = None
+        self._open_context()
 
     def __exit__(self, exc_type, exc, tb) -> None:
         self.close()
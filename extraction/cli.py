@@ -44,6 +44,11 @@ def build_parser() -> argparse.ArgumentParser:
     extract_parser.add_argument(
         "--max-steps", type=int, default=5, help="Max exploration steps after login"
     )
+    extract_parser.add_argument(
+        "--always-screenshot",
+        action="store_true",
+        help="Screenshot every captured view, not only views with indicators",
+    )
 
     map_parser = subparsers.add_parser(
         "map",
@@ -122,6 +127,7 @@ def main(argv: list[str] | None = None) -> None:
             run_paths=run_paths,
             logger=logger,
             max_steps=args.max_steps,
+            always_screenshot=args.always_screenshot,
         )
         result = run_extraction(inputs)
     elif args.command == "map":
@@ -9,6 +9,8 @@ from html.parser import HTMLParser
 from typing import Dict, Iterable, List, Tuple
 from urllib.parse import urlparse
 
+from .keywords import keyword_pattern
+
 
 @dataclass(slots=True)
 class ExtractedData:
@@ -28,6 +30,18 @@ BTC_PATTERN = re.compile(
 )
 ETH_PATTERN = re.compile(r"\b0x[a-fA-F0-9]{40}\b")
 TRON_PATTERN = re.compile(r"\bT[1-9A-HJ-NP-Za-km-z]{33}\b")
+# All crypto patterns fused for yes/no checks; only bech32 is case-insensitive,
+# and its group is named so the mixed-case rejection can still be applied.
+CRYPTO_ANY_PATTERN = re.compile(
+    "|".join(
+        (
+            BTC_LEGACY_PATTERN.pattern,
+            f"(?P<bech32>(?i:{BTC_BECH32_PATTERN.pattern}))",
+            ETH_PATTERN.pattern,
+            TRON_PATTERN.pattern,
+        )
+    )
+)
 
 # Bank/beneficiary patterns (unchanged)
 IBAN_PATTERN = re.compile(r"\b[A-Z]{2}[0-9]{2}[A-Z0-9]{10,30}\b")
@@ -40,31 +54,34 @@ BANK_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
-BLOCKED_TAGS = {"script", "style", "iframe"}
-BLOCKED_ATTR_TAGS = {"script", "style", "iframe", "link", "meta"}
-INFRA_ATTR_NAMES = {"src", "href", "integrity", "content"}
-VISIBLE_TEXT_TAGS = {
-    "a",
-    "b",
-    "code",
-    "div",
-    "em",
-    "h1",
-    "h2",
-    "h3",
-    "h4",
-    "h5",
-    "h6",
-    "i",
-    "label",
-    "li",
-    "p",
-    "pre",
-    "span",
-    "strong",
-    "td",
-    "th",
-}
+BLOCKED_TAGS = frozenset({"script", "style", "iframe"})
+BLOCKED_ATTR_TAGS = frozenset({"script", "style", "iframe", "link", "meta"})
+INFRA_ATTR_NAMES = frozenset({"src", "href", "integrity", "content"})
+TEXTUAL_INPUT_TYPES = frozenset({"text", "tel", "hidden", ""})
+VISIBLE_TEXT_TAGS = frozenset(
+    {
+        "a",
+        "b",
+        "code",
+        "div",
+        "em",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "i",
+        "label",
+        "li",
+        "p",
+        "pre",
+        "span",
+        "strong",
+        "td",
+        "th",
+    }
+)
 INFRA_DOMAIN_KEYWORDS = (
     "stripe.com",
     "stripe.network",
@@ -86,6 +103,10 @@ INPUT_POSITIVE_CLASS_HINTS = (
     "deposit",
     "payment",
 )
+# Substring tests against every URL and input class seen while scanning, so
+# each hint tuple is one alternation rather than a per-hint loop.
+_INFRA_DOMAIN_RE = keyword_pattern(INFRA_DOMAIN_KEYWORDS)
+_INPUT_POSITIVE_CLASS_RE = keyword_pattern(INPUT_POSITIVE_CLASS_HINTS)
 
 
 def strip_html(raw_html: str) -> str:
@@ -136,6 +157,16 @@ def _iter_crypto_matches(
         yield ("TRON", match.group(0), match.start(), match.end())
 
 
+def contains_crypto_string(text: str) -> bool:
+    if not text:
+        return False
+    for match in CRYPTO_ANY_PATTERN.finditer(text):
+        if match.lastgroup == "bech32" and not _is_bech32_case_valid(match.group(0)):
+            continue
+        return True
+    return False
+
+
 def iter_crypto_strings(text: str) -> Iterable[Tuple[str, str]]:
     for indicator_type, value, _, _ in _iter_crypto_matches(text):
         yield indicator_type, value
@@ -148,7 +179,7 @@ def _is_infra_url(value: str) -> bool:
         host = urlparse(f"http:{value}").netloc.lower()
     if not host:
         return False
-    return any(token in host for token in INFRA_DOMAIN_KEYWORDS)
+    return _INFRA_DOMAIN_RE.search(host) is not None
 
 
 def _is_positive_context(
@@ -163,8 +194,8 @@ def _is_positive_context(
             return bool(
                 attrs.get("readonly") is not None
                 or attrs.get("disabled") is not None
-                or any(hint in class_value for hint in INPUT_POSITIVE_CLASS_HINTS)
-                or input_type in ("text", "tel", "hidden", "")
+                or _INPUT_POSITIVE_CLASS_RE.search(class_value) is not None
+                or input_type in TEXTUAL_INPUT_TYPES
             )
         return False
     if tag is None:
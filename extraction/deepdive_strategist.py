@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
 import re
-from dataclasses import asdict, dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from enum import Enum
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from playwright.sync_api import ElementHandle
+from playwright.sync_api import ElementHandle, JSHandle
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
@@ -19,9 +23,26 @@ from .archival_crawler import (
     _registrable_domain,
     extract_links,
 )
-from .automation import click_by_text, submit_form_element
-from .browser import BrowserConfig, BrowserSession
-from .io_utils import RunPaths, relative_artifact_path, sanitize_filename, save_text
+from .automation import (
+    click_by_pattern,
+    click_by_text,
+    submit_form_element,
+)
+from .browser import (
+    DOCUMENT_REVISION_JS,
+    MUTATION_COUNTER_SCRIPT,
+    BrowserConfig,
+    BrowserSession,
+    mutation_count,
+    wait_for_dom_settled,
+)
+from .io_utils import (
+    RunPaths,
+    relative_artifact_path,
+    sanitize_filename,
+    save_text,
+)
+from .keywords import keyword_pattern
 from .login_flow import (
     perform_login,
 )
@@ -29,6 +50,7 @@ from .parsing import Indicator, extract_indicators, has_crypto_match
 
 MODULE_LOGGER = logging.getLogger(__name__)
 
+
 FUNDING_KEYWORDS = (
     "deposit",
     "wallet",
@@ -59,6 +81,9 @@ DEPOSIT_METHOD_KEYWORDS = (
     "mastercard",
 )
 REVEAL_KEYWORDS = ("show", "view", "display", "copy", "reveal", "get address")
+_REVEAL_KEYWORD_PATTERNS = {
+    keyword: keyword_pattern((keyword,)) for keyword in REVEAL_KEYWORDS
+}
 DEPOSIT_CONTEXT_HINTS = (
     "deposit",
     "wallet",
@@ -70,7 +95,11 @@ DEPOSIT_CONTEXT_HINTS = (
     "finance",
     "top up",
 )
-CRYPTO_INDICATOR_TYPES = {"BTC", "ETH", "TRON"}
+_DEPOSIT_CONTEXT_RE = keyword_pattern(DEPOSIT_CONTEXT_HINTS)
+CRYPTO_INDICATOR_TYPES = frozenset({"BTC", "ETH", "TRON"})
+INERT_HREFS = frozenset(
+    {"#", "javascript:void(0)", "javascript:void(0);", "javascript:;"}
+)
 ACTION_TEXT_HINTS = (
     "deposit",
     "choose",
@@ -94,6 +123,7 @@ ICON_CLASS_HINTS = (
     "plus",
 )
 COPY_BUTTON_KEYWORDS = ("copy", "clipboard")
+_COPY_KEYWORD_RE = keyword_pattern(COPY_BUTTON_KEYWORDS)
 POTENTIAL_CONTAINER_SELECTORS = (
     "[class*='method' i]",
     "[class*='option' i]",
@@ -107,15 +137,35 @@ POTENTIAL_CONTAINER_SELECTORS = (
     "article",
     "div",
 )
-MODAL_WAIT_SELECTOR = (
+MODAL_OPEN_SELECTOR = (
     ".modal.show, [role='dialog'], .modal[style*='display: block'], .ant-modal, "
     ".chakra-modal__content, .MuiDialog-root, .v-modal, .ant-drawer-open"
 )
+# Frameworks such as ant keep closed modals mounted, so only rendered
+# matches count as open.
+_MODAL_OPEN_JS = (
+    "sel => [...document.querySelectorAll(sel)]"
+    ".some((el) => el.getClientRects().length > 0)"
+)
+# Tried in order; a union selector would pick by document position instead.
+MODAL_CLOSE_SELECTORS = (
+    "button:has-text('Close')",
+    "button:has-text('Cancel')",
+    "button[aria-label='Close']",
+    ".modal button.close",
+    ".ant-modal-close",
+)
 
 PAYMENT_TOGGLE_PATTERN = re.compile(
     r"(method|payment|pay|gateway|channel|crypto|coin|type|process)", re.IGNORECASE
 )
 MAX_LABEL_CHARS = 120
+# Stop revealing once crypto indicators exist and this many reveals added none.
+REVEAL_STALE_LIMIT = 2
+# networkidle rarely arrives on pages with analytics beacons or long polls;
+# after DOM ready the load event only gets this long.
+LOAD_GRACE_MS = 3000
+SCREENSHOT_JPEG_QUALITY = 70
 
 
 @dataclass(slots=True)
@@ -126,6 +176,9 @@ class ProbeInputs:
     run_paths: RunPaths
     logger: logging.Logger
     max_steps: int = 5
+    always_screenshot: bool = False
+    # Running session from ``warm_browser``; each probe gets a fresh context on it.
+    browser: Optional[BrowserSession] = None
 
 
 @dataclass(slots=True)
@@ -134,7 +187,7 @@ class ProbeResult:
     input_url: str
     final_url: str
     status: str
-    notes: str
+    notes: List[str]
     indicators: List[Indicator]
     artifacts: List[str]
 
@@ -144,12 +197,44 @@ class ProbeResult:
             "input_url": self.input_url,
             "final_url": self.final_url,
             "status": self.status,
-            "notes": self.notes,
-            "indicators": [asdict(indicator) for indicator in self.indicators],
+            "notes": " | ".join(self.notes),
+            "indicators": [indicator.to_dict() for indicator in self.indicators],
             "artifacts": self.artifacts,
         }
 
 
+def _probe_browser_config(always_screenshot: bool) -> BrowserConfig:
+    return BrowserConfig(
+        always_screenshot=always_screenshot,
+        init_scripts=(MUTATION_COUNTER_SCRIPT, PAGE_HELPERS_SCRIPT),
+    )
+
+
+@contextmanager
+def warm_browser(always_screenshot: bool = False) -> Iterator[BrowserSession]:
+    """Keep one Chromium running across probes; pass it via ``ProbeInputs.browser``."""
+    with BrowserSession(_probe_browser_config(always_screenshot)) as browser:
+        yield browser
+
+
+@contextmanager
+def _probe_session(inputs: ProbeInputs) -> Iterator[BrowserSession]:
+    if inputs.browser is None:
+        with BrowserSession(_probe_browser_config(inputs.always_screenshot)) as browser:
+            yield browser
+        return
+    # The warm browser is shared across probes: apply this probe's screenshot
+    # setting only for its duration.
+    browser = inputs.browser
+    shared_config = browser.config
+    browser.config = replace(shared_config, always_screenshot=inputs.always_screenshot)
+    try:
+        browser.reset_context()
+        yield browser
+    finally:
+        browser.config = shared_config
+
+
 def run_targeted_probe(inputs: ProbeInputs) -> ProbeResult:
     logger = inputs.logger
     run_paths = inputs.run_paths
@@ -161,11 +246,13 @@ def run_targeted_probe(inputs: ProbeInputs) -> ProbeResult:
 
     try:
         logger.debug("Starting targeted probe for %s as %s", inputs.url, inputs.email)
-        with BrowserSession(BrowserConfig()) as browser:
-            page = browser.goto(inputs.url, wait_until="networkidle")
+        with _probe_session(inputs) as browser:
+            page = browser.goto(inputs.url, wait_until="domcontentloaded")
+            _wait_for_load_grace(page, logger)
             final_url = page.url
             logger.debug("Loaded entry page %s", final_url)
-            landing_shot = browser.screenshot(run_paths.build_path("00_landing.png"))
+            landing_shot = run_paths.build_path("00_landing.jpg")
+            _write_in_background(landing_shot.write_bytes, _screenshot_bytes(page))
             artifacts.append(relative_artifact_path(landing_shot))
 
             logger.debug("Attempting authentication for targeted probe")
@@ -201,13 +288,15 @@ def run_targeted_probe(inputs: ProbeInputs) -> ProbeResult:
         notes.append(str(exc))
         status = "error"
 
-    notes_text = " | ".join(notes) if notes else ""
+    failed_writes = flush_artifact_writes(logger)
+    if failed_writes:
+        notes.append(f"{failed_writes} artifact file(s) could not be written")
     return ProbeResult(
         run_id=run_paths.run_id,
         input_url=inputs.url,
         final_url=final_url,
         status=status,
-        notes=notes_text,
+        notes=notes,
         indicators=indicator_records,
         artifacts=artifacts,
     )
@@ -223,16 +312,17 @@ def explore_interesting_pages(
     indicators: List[Indicator] = []
     page = browser.page
     steps = 0
-    visited_urls: Set[str] = set()
+    visited_urls: Set[bytes] = set()
 
     def _mark_visited(url: str) -> str:
         normalized = _normalize_url(url) or url
-        visited_urls.add(normalized)
+        visited_urls.add(_url_digest(normalized))
         return normalized
 
     def process_current_view(label: str) -> None:
-        normalized = _normalize_url(page.url) or page.url
-        if normalized in visited_urls:
+        url = page.url
+        normalized = _normalize_url(url) or url
+        if _url_digest(normalized) in visited_urls:
             logger.debug("Skipping capture for already visited URL %s", normalized)
             return
         _mark_visited(normalized)
@@ -244,10 +334,17 @@ def explore_interesting_pages(
 
     def run_keywords(keywords: Tuple[str, ...], prefix: str) -> None:
         nonlocal steps
+        # click_by_text costs up to three locator counts per keyword, so ask
+        # the page once which keywords it mentions, again after each click.
+        present = mentioned_keywords(page, keywords, logger)
         for keyword in keywords:
             if steps >= max_steps:
                 break
+            if present is not None and keyword not in present:
+                continue
             logger.debug("Exploration step %d: looking for '%s'", steps + 1, keyword)
+            pre_url = page.url
+            before_click = mutation_count(page)
             try:
                 clicked = click_by_text(page, keyword, logger=logger)
             except PlaywrightError as exc:
@@ -260,14 +357,21 @@ def explore_interesting_pages(
             if not clicked:
                 continue
             steps += 1
-            try:
-                page.wait_for_load_state("load", timeout=7000)
-            except PlaywrightTimeoutError:
-                logger.debug(
-                    "Navigation after clicking '%s' did not complete in time", keyword
-                )
+            # Only a real navigation needs a load-state wait; in-page state
+            # changes just need the DOM to settle.
+            if page.url != pre_url:
+                try:
+                    page.wait_for_load_state("domcontentloaded", timeout=3000)
+                except PlaywrightTimeoutError:
+                    logger.debug(
+                        "Navigation after clicking '%s' did not complete in time",
+                        keyword,
+                    )
+            else:
+                _wait_for_dom_settled(page, before_click, logger)
             label = f"{prefix}_{steps:02d}_{sanitize_filename(keyword)}"
             process_current_view(label)
+            present = mentioned_keywords(page, keywords, logger)
 
     _mark_visited(page.url)
     run_keywords(FUNDING_KEYWORDS, "step")
@@ -276,8 +380,11 @@ def explore_interesting_pages(
         logger.debug(
             "Deposit context not detected after primary pass; attempting menu fallback"
         )
+        before_menu = mutation_count(page)
         if click_menu(page, logger=logger):
-            page.wait_for_timeout(800)
+            # The opened menu exposes new controls, so every funding keyword
+            # is worth another try, including ones clicked in the first pass.
+            _wait_for_dom_settled(page, before_menu, logger)
             run_keywords(FUNDING_KEYWORDS, "step")
 
     def follow_deposit_links(max_links: int) -> int:
@@ -296,12 +403,8 @@ def explore_interesting_pages(
         except Exception as exc:  # noqa: BLE001
             logger.debug("extract_links failed during deep-dive deposit scan: %s", exc)
             return consumed
-        deposit_links: List[str] = []
-        for link in links:
-            normalized = _normalize_url(link) or link
-            lowered = normalized.lower()
-            if any(hint in lowered for hint in DEPOSIT_CONTEXT_HINTS):
-                deposit_links.append(link)
+        # extract_links already returns normalized URLs; one regex pass per link.
+        deposit_links = [link for link in links if _DEPOSIT_CONTEXT_RE.search(link)]
         logger.debug(
             "Identified %d deposit-like links on current page (candidates: %s)",
             len(deposit_links),
@@ -311,7 +414,7 @@ def explore_interesting_pages(
             if consumed >= max_links:
                 break
             normalized = _normalize_url(link) or link
-            if normalized in visited_urls:
+            if _url_digest(normalized) in visited_urls:
                 continue
             try:
                 page.goto(link, wait_until="load")
@@ -334,106 +437,97 @@ def explore_interesting_pages(
     return artifacts, indicators
 
 
+def _url_digest(url: str) -> bytes:
+    """Return a compact 64-bit digest used for visited-URL bookkeeping."""
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+
+
 def _looks_like_crypto(candidate: str) -> bool:
     if not candidate:
         return False
     return has_crypto_match(candidate)
 
 
+_INPUT_VALUES_JS = """
+() => [...document.querySelectorAll('input, textarea')]
+    .map((el) => (el.value || '').trim())
+    .filter(Boolean)
+"""
+
+
 def _collect_input_values(page, logger: logging.Logger) -> List[str]:
     try:
-        elements = page.query_selector_all("input, textarea")
+        return list(_call_page_helper(page, "inputValues") or [])
     except PlaywrightError as exc:
-        logger.debug("Unable to enumerate input controls: %s", exc)
+        logger.debug("Unable to read input control values: %s", exc)
         return []
-    values: List[str] = []
-    for element in elements:
-        try:
-            raw = element.input_value()
-        except PlaywrightError:
-            continue
-        value = raw.strip()
-        if value:
-            values.append(value)
-    return values
+
+
+COPY_CONTROL_SELECTOR = (
+    "button, a, [role='button'], [class*='copy' i], [class*='clipboard' i]"
+)
+
+# Finds copy/clipboard controls and gathers their neighbours' values and text
+# in one pass. Text, class and aria-label are NUL-joined lanes so a keyword
+# cannot straddle two of them.
+_COPY_NEIGHBOR_JS = """
+({ selector, pattern }) => {
+    const keywordRe = new RegExp(pattern, 'i');
+    const values = [];
+    const pushNode = (node) => {
+        if (!node) {
+            return;
+        }
+        if (typeof node.value === 'string' && node.value.trim()) {
+            values.push(node.value.trim());
+        }
+        if (node.getAttribute) {
+            const attrValue = node.getAttribute('value');
+            if (attrValue && attrValue.trim()) {
+                values.push(attrValue.trim());
+            }
+        }
+        const text = (node.innerText || node.textContent || '').trim();
+        if (text) {
+            values.push(text);
+        }
+    };
+    for (const el of document.querySelectorAll(selector)) {
+        const haystack = [
+            el.innerText || '',
+            el.getAttribute('class') || '',
+            el.getAttribute('aria-label') || '',
+        ].join('\\u0000');
+        if (!keywordRe.test(haystack)) {
+            continue;
+        }
+        pushNode(el.previousElementSibling);
+        pushNode(el.nextElementSibling);
+        const parent = el.parentElement;
+        if (parent && parent.children.length <= 5) {
+            for (const child of parent.children) {
+                if (child !== el) {
+                    pushNode(child);
+                }
+            }
+        }
+    }
+    return values;
+}
+"""
 
 
 def _collect_copy_neighbor_text(page, logger: logging.Logger) -> List[str]:
-    selectors = "button, a, [role='button'], [class*='copy' i], [class*='clipboard' i]"
     try:
-        elements = page.query_selector_all(selectors)
+        neighbors = _call_page_helper(
+            page,
+            "copyNeighborText",
+            {"selector": COPY_CONTROL_SELECTOR, "pattern": _COPY_KEYWORD_RE.pattern},
+        )
     except PlaywrightError as exc:
         logger.debug("Unable to scan copy controls: %s", exc)
         return []
-    snippets: List[str] = []
-    for element in elements:
-        try:
-            text = (element.inner_text() or "").strip().lower()
-        except PlaywrightError:
-            text = ""
-        matched = any(keyword in text for keyword in COPY_BUTTON_KEYWORDS)
-        if not matched:
-            try:
-                attr_text = (element.get_attribute("class") or "").lower()
-            except PlaywrightError:
-                attr_text = ""
-            matched = any(keyword in attr_text for keyword in COPY_BUTTON_KEYWORDS)
-        if not matched:
-            try:
-                aria_label = (element.get_attribute("aria-label") or "").lower()
-            except PlaywrightError:
-                aria_label = ""
-            matched = any(keyword in aria_label for keyword in COPY_BUTTON_KEYWORDS)
-        if not matched:
-            continue
-        try:
-            neighbors = (
-                element.evaluate(
-                    """
-                (el) => {
-                    const values = [];
-                    const pushNode = (node) => {
-                        if (!node) {
-                            return;
-                        }
-                        if (typeof node.value === 'string' && node.value.trim()) {
-                            values.push(node.value.trim());
-                        }
-                        if (node.getAttribute) {
-                            const attrValue = node.getAttribute('value');
-                            if (attrValue && attrValue.trim()) {
-                                values.push(attrValue.trim());
-                            }
-                        }
-                        const text = (node.innerText || node.textContent || '').trim();
-                        if (text) {
-                            values.push(text);
-                        }
-                    };
-                    pushNode(el.previousElementSibling);
-                    pushNode(el.nextElementSibling);
-                    const parent = el.parentElement;
-                    if (parent && parent.children.length <= 5) {
-                        for (const child of parent.children) {
-                            if (child === el) {
-                                continue;
-                            }
-                            pushNode(child);
-                        }
-                    }
-                    return values;
-                }
-                """
-                )
-                or []
-            )
-        except PlaywrightError:
-            continue
-        for neighbor in neighbors:
-            snippet = str(neighbor).strip()
-            if snippet:
-                snippets.append(snippet)
-    return snippets
+    return [str(neighbor) for neighbor in neighbors or [] if neighbor]
 
 
 def _collect_hidden_value_strings(
@@ -454,20 +548,78 @@ def _collect_hidden_value_strings(
     return extras
 
 
+DomSnapshot = Tuple[str, List[Tuple[str, str]]]
+
+# The most recent snapshot and the (url, document revision) it was taken at;
+# consecutive captures of an unchanged document reuse it. One entry only,
+# since a DOM dump can run to megabytes.
+_LAST_SNAPSHOT: Optional[Tuple[Tuple[str, str], DomSnapshot]] = None
+
+
 def _snapshot_dom(
     page,
+    revision: Optional[str],
     logger: logging.Logger | None,
-) -> Tuple[str, List[Tuple[str, str]]]:
+) -> DomSnapshot:
+    global _LAST_SNAPSHOT
     log = logger or MODULE_LOGGER
+    key = (page.url, revision) if revision else None
+    if key and _LAST_SNAPSHOT and _LAST_SNAPSHOT[0] == key:
+        log.debug("Reusing DOM snapshot for unchanged %s", page.url)
+        return _LAST_SNAPSHOT[1]
     try:
         html = page.content()
     except PlaywrightError as exc:
         log.debug("Failed to read page.content(): %s", exc)
         html = ""
     extra_strings = _collect_hidden_value_strings(page, log)
+    _LAST_SNAPSHOT = (key, (html, extra_strings)) if key else None
     return html, extra_strings
 
 
+# Untagged indicators extracted from _LAST_SNAPSHOT, so a fingerprint scan
+# and a capture of the same document revision share one extraction pass.
+_LAST_SCAN: Optional[Tuple[Tuple[str, str], List[Indicator]]] = None
+
+
+# Untagged indicators keyed by (url, content digest). SPA views often return
+# to byte-identical markup under a new document revision (e.g. a modal that
+# opened and closed), which _LAST_SCAN cannot see; hashing is far cheaper
+# than the extraction pass it saves.
+INDICATOR_CACHE_LIMIT = 32
+_INDICATOR_CACHE: Dict[Tuple[str, bytes], List[Indicator]] = {}
+
+
+def _snapshot_digest(snapshot: DomSnapshot) -> bytes:
+    html, extra_strings = snapshot
+    hasher = hashlib.blake2b(html.encode("utf-8", "ignore"), digest_size=16)
+    for label, text in extra_strings:
+        hasher.update(f"\0{label}\0{text}".encode("utf-8", "ignore"))
+    return hasher.digest()
+
+
+def _extract_snapshot_indicators(
+    url: str, revision: Optional[str], snapshot: DomSnapshot
+) -> List[Indicator]:
+    global _LAST_SCAN
+    key = (url, revision) if revision else None
+    if key and _LAST_SCAN and _LAST_SCAN[0] == key:
+        return _LAST_SCAN[1]
+    html, extra_strings = snapshot
+    if html or extra_strings:
+        digest = _snapshot_digest(snapshot)
+        indicators = _INDICATOR_CACHE.get((url, digest))
+        if indicators is None:
+            indicators = extract_indicators(html, url, extra_strings=extra_strings)
+            if len(_INDICATOR_CACHE) >= INDICATOR_CACHE_LIMIT:
+                _INDICATOR_CACHE.clear()
+            _INDICATOR_CACHE[(url, digest)] = indicators
+    else:
+        indicators = []
+    _LAST_SCAN = (key, indicators) if key else None
+    return indicators
+
+
 def _safe_artifact_label(raw: str) -> str:
     base = sanitize_filename(raw) or "page"
     if len(base) <= MAX_LABEL_CHARS:
@@ -477,55 +629,228 @@ def _safe_artifact_label(raw: str) -> str:
     return f"{head}_{digest}"
 
 
-def _scan_crypto_fingerprint(page, logger: logging.Logger) -> Set[Tuple[str, str]]:
-    html, extra_strings = _snapshot_dom(page, logger)
-    indicators = extract_indicators(html, page.url, extra_strings=extra_strings)
-    fingerprint: Set[Tuple[str, str]] = set()
-    for indicator in indicators:
-        if indicator.type in CRYPTO_INDICATOR_TYPES:
-            fingerprint.add((indicator.type, indicator.value))
-    return fingerprint
+# Indicator fingerprints of every type keyed by (url, document revision); a
+# full scan is only repeated once the DOM has changed since the last capture
+# or scan.
+FINGERPRINT_CACHE_LIMIT = 32
+_FINGERPRINT_CACHE: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+
+
+def _remember_fingerprint(
+    url: str, revision: Optional[str], fingerprint: Set[Tuple[str, str]]
+) -> None:
+    if revision is None:
+        return
+    if len(_FINGERPRINT_CACHE) >= FINGERPRINT_CACHE_LIMIT:
+        _FINGERPRINT_CACHE.clear()
+    _FINGERPRINT_CACHE[(url, revision)] = fingerprint
+
+
+def _scan_fingerprint(
+    page,
+    logger: logging.Logger,
+    types: Optional[frozenset] = CRYPTO_INDICATOR_TYPES,
+) -> Set[Tuple[str, str]]:
+    url = page.url
+    revision = _document_revision(page)
+    fingerprint = _FINGERPRINT_CACHE.get((url, revision)) if revision else None
+    if fingerprint is None:
+        snapshot = _snapshot_dom(page, revision, logger)
+        indicators = _extract_snapshot_indicators(url, revision, snapshot)
+        fingerprint = _indicator_fingerprint(indicators, None)
+        _remember_fingerprint(url, revision, fingerprint)
+    return _filter_fingerprint(fingerprint, types)
+
+
+# Records what changed in the DOM since tracking started so crypto scans
+# after an interaction only parse the delta: outerHTML of added elements, the
+# new text of changed attributes and text nodes, and every input whose value
+# differs from the last drain. Values are compared rather than observed, since
+# script writes to .value produce no mutation record.
+_TRACK_MUTATIONS_JS = """
+() => {
+    if (window.__asDelta) {
+        window.__asDelta.observer.disconnect();
+    }
+    const delta = { added: new Set(), strings: [], values: new WeakMap() };
+    for (const field of document.querySelectorAll('input, textarea')) {
+        delta.values.set(field, field.value);
+    }
+    delta.observer = new MutationObserver((records) => {
+        for (const record of records) {
+            if (record.type === 'childList') {
+                for (const node of record.addedNodes) {
+                    if (node.nodeType === Node.ELEMENT_NODE) {
+                        delta.added.add(node);
+                    } else if (node.textContent) {
+                        delta.strings.push(['text', node.textContent]);
+                    }
+                }
+            } else if (record.type === 'attributes') {
+                const value = record.target.getAttribute(record.attributeName);
+                if (value) {
+                    delta.strings.push([record.attributeName, value]);
+                }
+            } else if (record.target.textContent) {
+                delta.strings.push(['text', record.target.textContent]);
+            }
+        }
+    });
+    delta.observer.observe(document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        characterData: true,
+    });
+    window.__asDelta = delta;
+    return true;
+}
+"""
+
+_DRAIN_MUTATIONS_JS = """
+() => {
+    const delta = window.__asDelta;
+    if (!delta) {
+        return null;
+    }
+    const html = [];
+    const extras = delta.strings.splice(0);
+    for (const el of delta.added) {
+        if (el.isConnected) {
+            html.push(el.outerHTML);
+        }
+    }
+    delta.added.clear();
+    for (const field of document.querySelectorAll('input, textarea')) {
+        const value = field.value;
+        if (value && delta.values.get(field) !== value) {
+            extras.push(['input_value', value]);
+        }
+        delta.values.set(field, value);
+    }
+    return { html: html.join('\\n'), extras };
+}
+"""
+
+
+def _track_dom_changes(page, logger: logging.Logger) -> None:
+    try:
+        _call_page_helper(page, "trackMutations")
+    except PlaywrightError as exc:
+        logger.debug("Unable to start DOM change tracking: %s", exc)
+
+
+def _indicator_fingerprint(
+    indicators: Iterable[Indicator],
+    types: Optional[frozenset] = CRYPTO_INDICATOR_TYPES,
+) -> Set[Tuple[str, str]]:
+    """(type, value) pairs of ``indicators``; ``types=None`` keeps every type."""
+    return {
+        (indicator.type, indicator.value)
+        for indicator in indicators
+        if types is None or indicator.type in types
+    }
+
+
+def _filter_fingerprint(
+    fingerprint: Set[Tuple[str, str]], types: Optional[frozenset]
+) -> Set[Tuple[str, str]]:
+    if types is None:
+        return set(fingerprint)
+    return {item for item in fingerprint if item[0] in types}
+
+
+def _scan_delta_fingerprint(
+    page,
+    logger: logging.Logger,
+    types: Optional[frozenset] = CRYPTO_INDICATOR_TYPES,
+) -> Set[Tuple[str, str]]:
+    """Fingerprint indicators of ``types`` in DOM changes since the last drain.
+
+    Falls back to a full scan, and restarts tracking, when the tracker is gone
+    (e.g. the interaction navigated). An empty delta also falls back to the
+    full scan, which is a cache hit while the document revision is unchanged.
+    """
+    try:
+        delta = _call_page_helper(page, "drainMutations")
+    except PlaywrightError as exc:
+        logger.debug("DOM delta unavailable: %s", exc)
+        delta = None
+    if delta is None:
+        # Navigation dropped the tracker; rescan and track the new document.
+        _track_dom_changes(page, logger)
+        return _scan_fingerprint(page, logger, types)
+    html = delta.get("html") or ""
+    crypto_only = types is not None and types <= CRYPTO_INDICATOR_TYPES
+    extras = [
+        (label, text)
+        for label, text in delta.get("extras") or []
+        if text and (not crypto_only or _looks_like_crypto(text))
+    ]
+    if not html and not extras:
+        return _scan_fingerprint(page, logger, types)
+    return _indicator_fingerprint(
+        extract_indicators(html, page.url, extra_strings=extras), types
+    )
 
 
 def _tag_indicators(
-    html: str,
-    url: str,
-    html_path: Path,
-    *,
-    extra_strings: Iterable[Tuple[str, str]] | None = None,
+    indicators: Iterable[Indicator], html_path: Path
 ) -> List[Indicator]:
-    tagged: List[Indicator] = []
-    for indicator in extract_indicators(html, url, extra_strings=extra_strings):
-        indicator.artifact = relative_artifact_path(html_path)
-        tagged.append(indicator)
-    return tagged
+    # Copies, since the untagged list may be shared through _LAST_SCAN.
+    artifact = relative_artifact_path(html_path)
+    return [replace(indicator, artifact=artifact) for indicator in indicators]
 
 
-def capture_page_state(
+# Artifact files are written from a small pool so disk I/O overlaps with
+# driving the browser; run_targeted_probe joins them before reporting.
+_ARTIFACT_IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="artifact-io")
+_PENDING_WRITES: List[Future] = []
+
+
+def _write_in_background(write, *args) -> None:
+    _PENDING_WRITES.append(_ARTIFACT_IO_POOL.submit(write, *args))
+
+
+def flush_artifact_writes(logger: logging.Logger | None = None) -> int:
+    """Wait for queued artifact writes; return how many of them failed."""
+    log = logger or MODULE_LOGGER
+    pending = list(_PENDING_WRITES)
+    _PENDING_WRITES.clear()
+    failures = 0
+    for write in pending:
+        try:
+            write.result()
+        except OSError as exc:
+            log.warning("Artifact write failed: %s", exc)
+            failures += 1
+    return failures
+
+
+def capture_html_and_scan(
     browser: BrowserSession,
     run_paths: RunPaths,
     label: str,
     logger: logging.Logger | None = None,
-) -> Tuple[List[str], List[Indicator]]:
+) -> Tuple[Path, List[Indicator]]:
     page = browser.page
     log = logger or MODULE_LOGGER
     safe_label = _safe_artifact_label(label)
     log.debug(
         "Capturing page state '%s' as '%s' at URL %s", label, safe_label, page.url
     )
-    html, extra_strings = _snapshot_dom(page, log)
-    html_path = save_text(run_paths.build_path(f"{safe_label}.html"), html)
-    screenshot_path = browser.screenshot(run_paths.build_path(f"{safe_label}.png"))
-    artifacts = [
-        relative_artifact_path(html_path),
-        relative_artifact_path(screenshot_path),
-    ]
+    revision = _document_revision(page)
+    snapshot = _snapshot_dom(page, revision, log)
+    html_path = run_paths.build_path(f"{safe_label}.html")
+    _write_in_background(save_text, html_path, snapshot[0])
     indicators = _tag_indicators(
-        html,
-        page.url,
-        html_path,
-        extra_strings=extra_strings,
+        _extract_snapshot_indicators(page.url, revision, snapshot), html_path
     )
+    # The capture doubles as a full crypto scan of this document revision.
+    _remember_fingerprint(page.url, revision, _indicator_fingerprint(indicators, None))
+    # Drop this frame's reference to the DOM dump; only the pending write and
+    # the single-entry snapshot cache keep it alive.
+    del snapshot
     if indicators:
         log.info(
             "Indicator scan for '%s' produced %d matches: %s",
@@ -535,6 +860,36 @@ def capture_page_state(
         )
     else:
         log.debug("Indicator scan for '%s' produced no matches", label)
+    return html_path, indicators
+
+
+def _screenshot_bytes(page) -> bytes:
+    # Screenshots are audit evidence; JPEG keeps the full page at a fraction
+    # of the PNG encode time and size.
+    return page.screenshot(full_page=True, type="jpeg", quality=SCREENSHOT_JPEG_QUALITY)
+
+
+def _wants_screenshot(
+    browser: BrowserSession, label: str, indicators: List[Indicator]
+) -> bool:
+    return bool(indicators) or "_reveal_" in label or browser.config.always_screenshot
+
+
+def capture_page_state(
+    browser: BrowserSession,
+    run_paths: RunPaths,
+    label: str,
+    logger: logging.Logger | None = None,
+) -> Tuple[List[str], List[Indicator]]:
+    html_path, indicators = capture_html_and_scan(browser, run_paths, label, logger)
+    artifacts = [relative_artifact_path(html_path)]
+    # Screenshots are a costly encode; keep them for views worth auditing.
+    if _wants_screenshot(browser, label, indicators):
+        screenshot_path = run_paths.build_path(f"{_safe_artifact_label(label)}.jpg")
+        _write_in_background(
+            screenshot_path.write_bytes, _screenshot_bytes(browser.page)
+        )
+        artifacts.append(relative_artifact_path(screenshot_path))
     return artifacts, indicators
 
 
@@ -549,6 +904,7 @@ def reveal_hidden_sections(
     indicators: List[Indicator] = []
     page = browser.page
     clicks = 0
+    stale_reveals = 0
 
     # Prefer non-navigational interactions (buttons, anchors without real hrefs)
     # to avoid leaving the deposit page before deeper exploration.
@@ -565,14 +921,14 @@ def reveal_hidden_sections(
             href = ""
         if not href:
             return False
-        if href in ("#", "javascript:void(0)", "javascript:void(0);", "javascript:;"):
+        if href in INERT_HREFS:
             return False
         if href.startswith("#"):
             return False
         return True
 
     def _click_reveal_action(keyword: str) -> bool:
-        pattern = re.compile(re.escape(keyword), re.IGNORECASE)
+        pattern = _REVEAL_KEYWORD_PATTERNS[keyword]
         try:
             button_locator = page.get_by_role("button", name=pattern)
             if button_locator.count() > 0:
@@ -608,20 +964,41 @@ def reveal_hidden_sections(
                 return True
         return False
 
+    # Like click_deposit_methods, fingerprint first and only capture a reveal
+    # that surfaced new indicators; the DOM delta keeps per-click scans cheap.
+    # Every indicator type counts here so revealed bank details are kept too.
+    _track_dom_changes(page, logger)
+    indicators_seen = _scan_fingerprint(page, logger, None)
     for keyword in REVEAL_KEYWORDS:
         if clicks >= max_clicks:
             break
+        before_click = mutation_count(page)
         clicked = _click_reveal_action(keyword)
         if not clicked:
             continue
         clicks += 1
-        page.wait_for_timeout(600)
-        label = f"{base_label}_reveal_{clicks:02d}_{sanitize_filename(keyword)}"
-        view_artifacts, view_indicators = capture_page_state(
-            browser, run_paths, label, logger
-        )
-        artifacts.extend(view_artifacts)
-        indicators.extend(view_indicators)
+        _wait_for_dom_settled(page, before_click, logger, timeout_ms=600)
+        fingerprint = _scan_delta_fingerprint(page, logger, None)
+        if not fingerprint <= indicators_seen:
+            label = f"{base_label}_reveal_{clicks:02d}_{sanitize_filename(keyword)}"
+            view_artifacts, view_indicators = capture_page_state(
+                browser, run_paths, label, logger
+            )
+            artifacts.extend(view_artifacts)
+            indicators.extend(view_indicators)
+            stale_reveals = 0
+        else:
+            logger.debug(
+                "Reveal via '%s' surfaced no new indicators; not capturing", keyword
+            )
+            stale_reveals += 1
+        indicators_seen |= fingerprint
+        if indicators_seen and stale_reveals >= REVEAL_STALE_LIMIT:
+            logger.debug(
+                "Indicator fingerprint unchanged for %d reveals; stopping reveal pass",
+                stale_reveals,
+            )
+            break
     return artifacts, indicators
 
 
@@ -630,87 +1007,202 @@ def _format_has_text_selector(base: str, text: str) -> str:
     return f'{base}:has-text("{safe}")'
 
 
+_ACTION_BASES = ("button", "[role='button']", "a")
+_ACTION_HINT_SELECTOR = ", ".join(
+    _format_has_text_selector(base, text)
+    for text in ACTION_TEXT_HINTS
+    for base in _ACTION_BASES
+)
+_ICON_HINT_SELECTOR = ", ".join(f"[class*='{hint}' i]" for hint in ICON_CLASS_HINTS)
+_GENERIC_ACTION_SELECTOR = (
+    "button, [role='button'], a, input[type='button'], input[type='submit']"
+)
+
+
+def _format_action_keyword_selector(keyword: str) -> str:
+    return ", ".join(_format_has_text_selector(base, keyword) for base in _ACTION_BASES)
+
+
+# Keyword tier selectors for the built-in method keywords are assembled once
+# at import; only unknown keywords are formatted per lookup.
+_METHOD_KEYWORD_SELECTORS = {
+    keyword: _format_action_keyword_selector(keyword)
+    for keyword in DEPOSIT_METHOD_KEYWORDS
+}
+
+
+def _action_keyword_selector(keyword: str) -> str:
+    cached = _METHOD_KEYWORD_SELECTORS.get(keyword)
+    return cached if cached is not None else _format_action_keyword_selector(keyword)
+
+
+_CONTAINER_OF_JS = """
+(el) => {
+    for (const selector of window.__asHelpers.containerSelectors) {
+        if (typeof el.closest === 'function') {
+            const match = el.closest(selector);
+            if (match) {
+                return match;
+            }
+        }
+    }
+    let current = el.parentElement;
+    let depth = 0;
+    while (current && depth < 5) {
+        if (current.matches && current.matches('div, li, section, article, tr')) {
+            return current;
+        }
+        current = current.parentElement;
+        depth += 1;
+    }
+    return el;
+}
+"""
+
+
 def _locate_container_from_handle(
     handle: ElementHandle, logger: logging.Logger
 ) -> ElementHandle:
     try:
-        container = handle.evaluate_handle(
-            """
-            (el, selectors) => {
-                for (const selector of selectors) {
-                    if (typeof el.closest === 'function') {
-                        const match = el.closest(selector);
-                        if (match) {
-                            return match;
-                        }
-                    }
-                }
-                let current = el.parentElement;
-                let depth = 0;
-                while (current && depth < 5) {
-                    if (current.matches && current.matches('div, li, section, article, tr')) {
-                        return current;
-                    }
-                    current = current.parentElement;
-                    depth += 1;
-                }
-                return el;
-            }
-            """,
-            list(POTENTIAL_CONTAINER_SELECTORS),
-        )
+        container = _call_element_helper(handle, "containerOf")
     except PlaywrightError as exc:
         logger.debug("Container detection failed: %s", exc)
         container = None
     return container or handle
 
 
+OPTION_LABEL_KEYWORDS = (
+    "bitcoin",
+    "btc",
+    "ethereum",
+    "eth",
+    "tether",
+    "usdt",
+    "trc20",
+    "erc20",
+    "tron",
+    "ltc",
+    "litecoin",
+    "bank transfer",
+    "wire",
+    "visa",
+    "mastercard",
+)
+_OPTION_LABEL_RE = keyword_pattern(OPTION_LABEL_KEYWORDS)
+
+
 def _normalize_option_label(raw_label: str, raw_value: str) -> str:
     text = (raw_label or raw_value or "").strip()
     if not text:
         return "option"
-    lowered = text.lower()
-    for kw in (
-        "bitcoin",
-        "btc",
-        "ethereum",
-        "eth",
-        "tether",
-        "usdt",
-        "trc20",
-        "erc20",
-        "tron",
-        "ltc",
-        "litecoin",
-        "bank transfer",
-        "wire",
-        "visa",
-        "mastercard",
-    ):
-        if kw in lowered:
-            return kw.replace(" ", "_")
+    match = _OPTION_LABEL_RE.search(text)
+    if match:
+        return match.group(0).lower().replace(" ", "_")
     if len(text) > 40:
         return text[:40].strip()
     return text
 
 
+# Walks the DOM once for every keyword, keeping the innermost elements whose
+# text contains it (mirroring get_by_text), and parks the hits on window so
+# individual handles can be resolved later by index.
+_KEYWORD_NODE_SCAN_JS = """
+(keywords) => {
+    const skipped = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE']);
+    const elements = document.body
+        ? [...document.body.querySelectorAll('*')].filter(
+              (el) => !skipped.has(el.tagName)
+          )
+        : [];
+    // textContent is O(subtree), so lower-case it once per element and drop
+    // elements that mention none of the keywords before the per-keyword pass.
+    const texts = new Map();
+    const textOf = (el) => {
+        let text = texts.get(el);
+        if (text === undefined) {
+            text = (el.textContent || '').toLowerCase();
+            texts.set(el, text);
+        }
+        return text;
+    };
+    const needles = keywords.map((keyword) => keyword.toLowerCase());
+    const candidates = elements.filter((el) => {
+        const text = textOf(el);
+        return needles.some((needle) => text.includes(needle));
+    });
+    const nodes = [];
+    const hitsByKeyword = {};
+    keywords.forEach((keyword, keywordIndex) => {
+        const needle = needles[keywordIndex];
+        const hits = [];
+        for (const el of candidates) {
+            if (hits.length >= 2) {
+                break;
+            }
+            if (!textOf(el).includes(needle)) {
+                continue;
+            }
+            const inner = [...el.children].some((child) =>
+                textOf(child).includes(needle)
+            );
+            if (!inner) {
+                hits.push(nodes.push(el) - 1);
+            }
+        }
+        hitsByKeyword[keyword] = hits;
+    });
+    window.__asKeywordNodes = nodes;
+    return hitsByKeyword;
+}
+"""
+
+
+def _scan_keyword_nodes(
+    page, keywords: Iterable[str], logger: logging.Logger
+) -> Optional[Dict[str, List[int]]]:
+    try:
+        return _call_page_helper(page, "scanKeywordNodes", list(keywords))
+    except PlaywrightError as exc:
+        logger.debug("Keyword node pre-scan failed: %s", exc)
+        return None
+
+
+# Resolves a pre-scanned keyword node and its container in one round trip;
+# null when the node was detached by an earlier click.
+_KEYWORD_CONTAINER_JS = """
+(idx) => {
+    const el = (window.__asKeywordNodes || [])[idx];
+    return el && el.isConnected ? window.__asHelpers.containerOf(el) : null;
+}
+"""
+
+
 def _find_keyword_container(
     page,
     keyword: str,
     occurrence: int,
     logger: logging.Logger,
+    keyword_hits: Optional[Dict[str, List[int]]] = None,
 ) -> Optional[ElementHandle]:
-    pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-    locator = page.get_by_text(pattern)
+    if keyword_hits is not None:
+        hits = keyword_hits.get(keyword) or []
+        if occurrence >= len(hits):
+            return None
+        try:
+            container = _call_element_helper(page, "keywordContainer", hits[occurrence])
+        except PlaywrightError as exc:
+            logger.debug("Pre-scanned node lookup failed for '%s': %s", keyword, exc)
+            container = None
+        if container:
+            return container
+        # The node went stale after an earlier click; fall back to a live query.
+    # A non-exact get_by_text is already a case-insensitive substring match
+    # evaluated by the selector engine, and nth() resolves in the same call.
+    locator = page.get_by_text(keyword, exact=False).nth(occurrence)
     try:
-        matches = locator.count()
-    except PlaywrightError as exc:
-        logger.debug("Unable to count locator matches for '%s': %s", keyword, exc)
-        return None
-    if matches == 0 or occurrence >= matches:
+        element = locator.element_handle(timeout=500)
+    except PlaywrightTimeoutError:
         return None
-    try:
-        element = locator.nth(occurrence).element_handle()
     except PlaywrightError as exc:
         logger.debug("Failed to fetch element handle for '%s': %s", keyword, exc)
         return None
@@ -720,92 +1212,127 @@ def _find_keyword_container(
 
 
 def _resolve_action_target(
-    container: ElementHandle,
-    keyword: str,
-    logger: logging.Logger,
+    container: ElementHandle, keyword: str, logger: logging.Logger
 ) -> ElementHandle:
-    text_hints = (keyword,) + ACTION_TEXT_HINTS
-    bases = ("button", "[role='button']", "a")
-    for text in text_hints:
-        for base in bases:
-            selector = _format_has_text_selector(base, text)
-            try:
-                target = container.query_selector(selector)
-            except PlaywrightError:
-                target = None
-            if target:
-                return target
-    for hint in ICON_CLASS_HINTS:
-        selector = f"[class*='{hint}' i]"
-        try:
-            target = container.query_selector(selector)
-        except PlaywrightError:
-            target = None
-        if target:
-            return target
-    for selector in (
-        "button",
-        "[role='button']",
-        "a",
-        "input[type='button']",
-        "input[type='submit']",
-    ):
+    # Each tier is one compound selector so the browser picks the match. The
+    # tier order is a priority, not a set of equivalents, so it is never
+    # profiled: the generic tier matches any control and must stay last.
+    tiers = (
+        _action_keyword_selector(keyword),
+        _ACTION_HINT_SELECTOR,
+        _ICON_HINT_SELECTOR,
+        _GENERIC_ACTION_SELECTOR,
+    )
+    for selector in tiers:
         try:
             target = container.query_selector(selector)
-        except PlaywrightError:
+        except PlaywrightError as exc:
+            logger.debug("Action target lookup failed for '%s': %s", keyword, exc)
             target = None
         if target:
             return target
     return container
 
 
+def _is_navigation_teardown(exc: PlaywrightError) -> bool:
+    message = str(exc).lower()
+    return "context was destroyed" in message or "navigat" in message
+
+
 def _safe_click_handle(handle: ElementHandle, logger: logging.Logger) -> bool:
-    try:
-        handle.scroll_into_view_if_needed(timeout=1000)
-    except PlaywrightError:
-        pass
+    # The native click scrolls into view, checks actionability and sends a
+    # trusted pointer sequence; the scripted click is only a fallback for
+    # elements it refuses (hidden or covered), so nothing is clicked twice.
     try:
         handle.click(timeout=4000)
         return True
     except PlaywrightError as exc:
+        if _is_navigation_teardown(exc):
+            return True
         logger.debug("Direct click failed: %s", exc)
     try:
         handle.evaluate("el => el.click && el.click()")
         return True
     except PlaywrightError as exc:
+        if _is_navigation_teardown(exc):
+            return True
         logger.debug("Scripted click failed: %s", exc)
     return False
 
 
-def _wait_for_modal_state(page, logger: logging.Logger) -> None:
+def _wait_for_mutation(page, since: int, timeout_ms: int) -> bool:
+    """Wait until the DOM mutated after count ``since``; False on timeout."""
     try:
-        page.wait_for_selector(MODAL_WAIT_SELECTOR, timeout=2000)
+        page.wait_for_function(
+            "since => (window.__asMutationCount || 0) > since",
+            arg=since,
+            timeout=timeout_ms,
+        )
+        return True
+    except PlaywrightError:
+        return False
+
+
+def _wait_for_load_grace(page, logger: logging.Logger) -> None:
+    """After DOM ready, wait at most LOAD_GRACE_MS for the load event."""
+    try:
+        page.wait_for_load_state("load", timeout=LOAD_GRACE_MS)
     except PlaywrightTimeoutError:
-        logger.debug("Modal selector did not appear before timeout; continuing")
-        page.wait_for_timeout(800)
+        logger.debug("%s still loading; continuing after DOM ready", page.url)
+
+
+def _wait_for_dom_settled(
+    page, since: int, logger: logging.Logger, timeout_ms: int = 800
+) -> None:
+    if not wait_for_dom_settled(page, since, timeout_ms):
+        logger.debug("DOM did not settle after interaction before timeout; continuing")
 
 
-def _dismiss_modal(page, logger: logging.Logger) -> None:
+def _modal_open(page) -> bool:
+    try:
+        return bool(page.evaluate(_MODAL_OPEN_JS, MODAL_OPEN_SELECTOR))
+    except PlaywrightError:
+        return False
+
+
+def _wait_for_modal_closed(page) -> bool:
+    """Wait briefly for open modals to go away; True once none is open."""
+    try:
+        page.wait_for_function(
+            f"sel => !({_MODAL_OPEN_JS})(sel)",
+            arg=MODAL_OPEN_SELECTOR,
+            timeout=500,
+        )
+        return True
+    except PlaywrightError:
+        return False
+
+
+def _dismiss_modal(page, logger: logging.Logger) -> bool:
+    """Press Escape and close any open modal; True if a modal was open."""
+    was_open = _modal_open(page)
     try:
         page.keyboard.press("Escape")
-        page.wait_for_timeout(200)
     except PlaywrightError:
         pass
-    close_selectors = (
-        "button:has-text('Close')",
-        "button:has-text('Cancel')",
-        "button[aria-label='Close']",
-        ".modal button.close",
-        ".ant-modal-close",
-    )
-    for selector in close_selectors:
+    # Without an open modal the close-button sweep is skipped so the page's
+    # own Close/Cancel buttons are left alone.
+    if not was_open:
+        return False
+    if _wait_for_modal_closed(page):
+        return True
+    for selector in MODAL_CLOSE_SELECTORS:
         try:
             handle = page.query_selector(selector)
         except PlaywrightError:
             handle = None
         if handle and _safe_click_handle(handle, logger):
-            page.wait_for_timeout(200)
+            _wait_for_modal_closed(page)
             break
+    return True
+
+
+PaymentOptionKey = Tuple[str, str]
 
 
 @dataclass(slots=True)
@@ -813,6 +1340,37 @@ class PaymentOption:
     value: str
     label: str
     handle: Optional[ElementHandle] = None
+    # Position in the <select>'s options collection, when select-based.
+    dom_index: Optional[int] = None
+    # Normalised (value, label) used to match options across detections.
+    key: PaymentOptionKey = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.key = (
+            (self.value or "").strip().lower(),
+            (self.label or "").strip().lower(),
+        )
+
+
+# (form, payment select or None, payment options, submit control, options
+# indexed by PaymentOption.key)
+DepositDetection = Tuple[
+    ElementHandle,
+    Optional[ElementHandle],
+    List[PaymentOption],
+    ElementHandle,
+    Dict[PaymentOptionKey, PaymentOption],
+]
+
+
+def _index_payment_options(
+    options: List[PaymentOption],
+) -> Dict[PaymentOptionKey, PaymentOption]:
+    index: Dict[PaymentOptionKey, PaymentOption] = {}
+    for option in options:
+        # Keep the first option per key, matching the old linear scan.
+        index.setdefault(option.key, option)
+    return index
 
 
 def _get_form_for_handle(
@@ -833,15 +1391,19 @@ def _get_form_for_handle(
     return element
 
 
+SUBMIT_PRIMARY_SELECTORS = (
+    "button[type='submit' i]",
+    "input[type='submit' i]",
+    "button:not([type])",
+)
+SUBMIT_TEXT_KEYWORDS = ("deposit", "continue", "confirm", "proceed", "next", "pay")
+SUBMIT_TEXT_BASES = ("button", "[role='button']", "input[type='button' i]", "a")
+
+
 def _find_submit_control(
     form: ElementHandle, logger: logging.Logger
 ) -> Optional[ElementHandle]:
-    primary_selectors = (
-        "button[type='submit' i]",
-        "input[type='submit' i]",
-        "button:not([type])",
-    )
-    for selector in primary_selectors:
+    for selector in SUBMIT_PRIMARY_SELECTORS:
         try:
             handle = form.query_selector(selector)
         except PlaywrightError as exc:
@@ -849,10 +1411,8 @@ def _find_submit_control(
             continue
         if handle:
             return handle
-    submit_keywords = ("deposit", "continue", "confirm", "proceed", "next", "pay")
-    text_bases = ("button", "[role='button']", "input[type='button' i]", "a")
-    for keyword in submit_keywords:
-        for base in text_bases:
+    for keyword in SUBMIT_TEXT_KEYWORDS:
+        for base in SUBMIT_TEXT_BASES:
             selector = _format_has_text_selector(base, keyword)
             try:
                 handle = form.query_selector(selector)
@@ -904,162 +1464,233 @@ def _ensure_plan_selection(form: ElementHandle, logger: logging.Logger) -> None:
             logger.debug("Unable to select plan radio for group '%s'", name)
 
 
-def _deposit_form_candidate(form: ElementHandle, logger: logging.Logger) -> bool:
-    try:
-        method = (form.get_attribute("method") or "").lower()
-    except PlaywrightError:
-        method = ""
-    if method and method != "post":
-        return False
-    try:
-        name_and_id = (
-            (form.get_attribute("name") or "") + " " + (form.get_attribute("id") or "")
-        ).lower()
-    except PlaywrightError:
-        name_and_id = ""
-    try:
-        deposit_input = form.query_selector("input[name='a' i][value*='deposit' i]")
-        token_input = form.query_selector(
-            "input[name='form_id' i], input[name*='token' i], input[name*='csrf' i]"
-        )
-    except PlaywrightError:
-        deposit_input = None
-        token_input = None
-    return bool(deposit_input or token_input or re.search("spend|deposit", name_and_id))
-
+PAYMENT_SELECT_SELECTORS = (
+    "select[name='type' i]",
+    "select[name*='method' i]",
+    "select[name*='payment' i]",
+)
+PAYMENT_DATA_ATTRIBUTES = (
+    "data-method",
+    "data-payment",
+    "data-pay",
+    "data-gateway",
+    "data-processor",
+    "data-coin",
+)
+PAYMENT_TOGGLE_SELECTOR = "input[type='radio' i], input[type='checkbox' i]"
+CLICKABLE_OPTION_SELECTOR = ", ".join(
+    [f"[{attr}]" for attr in PAYMENT_DATA_ATTRIBUTES] + [PAYMENT_TOGGLE_SELECTOR]
+)
 
-def _find_payment_select(
-    form: ElementHandle, logger: logging.Logger
-) -> Optional[ElementHandle]:
-    for selector in (
-        "select[name='type' i]",
-        "select[name*='method' i]",
-        "select[name*='payment' i]",
-    ):
-        try:
-            select = form.query_selector(selector)
-        except PlaywrightError as exc:
-            logger.debug("Payment select lookup failed for '%s': %s", selector, exc)
-            continue
-        if select:
-            return select
-    return None
+# Runs the whole deposit-form discovery in the page so it costs one round
+# trip: candidate heuristics, submit control, payment <select> options and
+# clickable payment options for the first form that qualifies. Clickable
+# options are limited to CLICKABLE_OPTION_SELECTOR matches.
+_DEPOSIT_FORM_DISCOVERY_JS = """
+(config) => {
+    const toggleRe = new RegExp(config.togglePattern, 'i');
+    const textOf = (el) =>
+        ((el.tagName === 'INPUT' ? el.value : el.innerText || el.textContent) || '')
+            .trim();
+    const isCandidate = (form) => {
+        const method = (form.getAttribute('method') || '').toLowerCase();
+        if (method && method !== 'post') {
+            return false;
+        }
+        const nameAndId = (
+            (form.getAttribute('name') || '') + ' ' + (form.getAttribute('id') || '')
+        ).toLowerCase();
+        return Boolean(
+            form.querySelector("input[name='a' i][value*='deposit' i]") ||
+                form.querySelector(
+                    "input[name='form_id' i], input[name*='token' i], " +
+                        "input[name*='csrf' i]"
+                ) ||
+                /spend|deposit/.test(nameAndId)
+        );
+    };
+    const findSubmit = (form) => {
+        for (const selector of config.submitSelectors) {
+            const match = form.querySelector(selector);
+            if (match) {
+                return match;
+            }
+        }
+        for (const keyword of config.submitKeywords) {
+            for (const base of config.submitBases) {
+                for (const el of form.querySelectorAll(base)) {
+                    if (textOf(el).toLowerCase().includes(keyword)) {
+                        return el;
+                    }
+                }
+            }
+        }
+        return null;
+    };
+    const findSelect = (form) => {
+        for (const selector of config.selectSelectors) {
+            const select = form.querySelector(selector);
+            if (!select) {
+                continue;
+            }
+            const options = [...select.options]
+                .map((opt, index) => ({
+                    value: (opt.getAttribute('value') || '').trim(),
+                    label: (opt.innerText || opt.textContent || '').trim(),
+                    index,
+                }))
+                .filter((opt) => opt.value || opt.label);
+            return { selector, options, el: select };
+        }
+        return null;
+    };
+    const containerOf = (el) => {
+        for (const selector of window.__asHelpers.containerSelectors) {
+            const match = el.closest(selector);
+            if (match) {
+                return match;
+            }
+        }
+        let current = el.parentElement;
+        let depth = 0;
+        while (current && depth < 5) {
+            if (current.matches('div, li, section, article, tr')) {
+                return current;
+            }
+            current = current.parentElement;
+            depth += 1;
+        }
+        return el;
+    };
+    const findClickable = (form) => {
+        const all = [...form.querySelectorAll(config.clickableSelector)];
+        const ordered = [];
+        const seen = new Set();
+        const add = (el) => {
+            if (!seen.has(el)) {
+                seen.add(el);
+                ordered.push(el);
+            }
+        };
+        for (const attr of config.dataAttributes) {
+            form.querySelectorAll(`[${attr}]`).forEach(add);
+        }
+        for (const el of form.querySelectorAll(config.toggleSelector)) {
+            const nameAndId = (
+                (el.getAttribute('name') || '') + ' ' + (el.getAttribute('id') || '')
+            ).toLowerCase();
+            const valueAttr = (el.getAttribute('value') || '').toLowerCase();
+            if (toggleRe.test(nameAndId) || toggleRe.test(valueAttr)) {
+                add(el);
+            }
+        }
+        return ordered.filter((el) => all.includes(el)).map((el) => {
+            let dataValue = '';
+            for (const attr of [...config.dataAttributes, 'value']) {
+                const candidate = el.getAttribute(attr);
+                if (candidate) {
+                    dataValue = candidate;
+                    break;
+                }
+            }
+            let label = (el.innerText || el.textContent || '').trim();
+            if (!label) {
+                label = (containerOf(el).innerText || '').trim();
+            }
+            return { el, dataValue: dataValue.trim(), label };
+        });
+    };
+    const allForms = [...document.querySelectorAll('form')];
+    // Let the selector engine drop forms with neither a payment select nor a
+    // clickable option before running the per-form heuristics; document
+    // order, and so the chosen form, is unchanged.
+    let forms = allForms;
+    try {
+        const payment = [...config.selectSelectors, config.clickableSelector].join(
+            ', '
+        );
+        forms = [...document.querySelectorAll(`form:has(${payment})`)];
+    } catch (err) {
+        forms = allForms;
+    }
+    // Elements are returned as handles next to the plain data, so Python
+    // never re-resolves them through a selector engine that may see a
+    // different set of nodes (Playwright CSS pierces open shadow roots).
+    for (const form of forms) {
+        if (!isCandidate(form)) {
+            continue;
+        }
+        const submit = findSubmit(form);
+        if (!submit) {
+            continue;
+        }
+        const data = { formIndex: allForms.indexOf(form), select: null, clickable: [] };
+        const select = findSelect(form);
+        if (select && select.options.length) {
+            data.select = { selector: select.selector, options: select.options };
+            return { data, form, submit, select: select.el, clickables: [] };
+        }
+        const clickable = findClickable(form);
+        if (clickable.length) {
+            data.clickable = clickable.map(({ dataValue, label }) => ({
+                dataValue,
+                label,
+            }));
+            const clickables = clickable.map((descriptor) => descriptor.el);
+            return { data, form, submit, select: null, clickables };
+        }
+    }
+    return null;
+}
+"""
+
+
+def _discover_deposit_form(page, logger: logging.Logger) -> Dict[str, JSHandle]:
+    config = {
+        "togglePattern": PAYMENT_TOGGLE_PATTERN.pattern,
+        "submitSelectors": list(SUBMIT_PRIMARY_SELECTORS),
+        "submitKeywords": list(SUBMIT_TEXT_KEYWORDS),
+        "submitBases": list(SUBMIT_TEXT_BASES),
+        "selectSelectors": list(PAYMENT_SELECT_SELECTORS),
+        "clickableSelector": CLICKABLE_OPTION_SELECTOR,
+        "dataAttributes": list(PAYMENT_DATA_ATTRIBUTES),
+        "toggleSelector": PAYMENT_TOGGLE_SELECTOR,
+    }
+    try:
+        return _call_handle_helper(page, "discoverDepositForm", config)
+    except PlaywrightError as exc:
+        logger.debug("Deposit form discovery failed on %s: %s", page.url, exc)
+        return {}
 
 
-def _extract_payment_options(
-    select: ElementHandle, logger: logging.Logger
+def _select_options_from_discovery(
+    descriptors: List[Dict[str, object]],
 ) -> List[PaymentOption]:
-    try:
-        option_handles = select.query_selector_all("option")
-    except PlaywrightError as exc:
-        logger.debug("Unable to enumerate payment options: %s", exc)
-        return []
     options: List[PaymentOption] = []
     seen: Set[Tuple[str, str]] = set()
-    for handle in option_handles:
-        try:
-            value = (handle.get_attribute("value") or "").strip()
-        except PlaywrightError:
-            value = ""
-        try:
-            label = (handle.inner_text() or handle.text_content() or "").strip()
-        except PlaywrightError:
-            label = ""
-        label = label or value
-        if not (value or label):
-            continue
+    for descriptor in descriptors:
+        value = str(descriptor.get("value") or "")
+        label = str(descriptor.get("label") or value)
         key = (value.lower(), label.lower())
         if key in seen:
             continue
         seen.add(key)
-        options.append(PaymentOption(value=value, label=label))
+        options.append(
+            PaymentOption(value=value, label=label, dom_index=descriptor.get("index"))
+        )
     return options
 
 
-def _extract_clickable_payment_options(
-    form: ElementHandle, logger: logging.Logger
+def _clickable_options_from_discovery(
+    descriptors: List[Dict[str, object]], handles: List[Optional[ElementHandle]]
 ) -> List[PaymentOption]:
-    selectors = (
-        "[data-method]",
-        "[data-payment]",
-        "[data-pay]",
-        "[data-gateway]",
-        "[data-processor]",
-        "[data-coin]",
-    )
-    handles: List[ElementHandle] = []
-    seen_handles: Set[int] = set()
-
-    def _add_handles(candidate_list: List[ElementHandle]) -> None:
-        for handle in candidate_list:
-            if handle and id(handle) not in seen_handles:
-                seen_handles.add(id(handle))
-                handles.append(handle)
-
-    for selector in selectors:
-        try:
-            matches = form.query_selector_all(selector)
-        except PlaywrightError as exc:
-            logger.debug("Clickable payment lookup failed for '%s': %s", selector, exc)
-            matches = []
-        _add_handles(matches)
-    try:
-        toggle_inputs = form.query_selector_all(
-            "input[type='radio' i], input[type='checkbox' i]"
-        )
-    except PlaywrightError as exc:
-        logger.debug("Toggle payment option lookup failed: %s", exc)
-        toggle_inputs = []
-    for toggle in toggle_inputs:
-        try:
-            name_and_id = (
-                (toggle.get_attribute("name") or "")
-                + " "
-                + (toggle.get_attribute("id") or "")
-            ).lower()
-            value_attr = (toggle.get_attribute("value") or "").lower()
-        except PlaywrightError:
-            name_and_id = ""
-            value_attr = ""
-        if not PAYMENT_TOGGLE_PATTERN.search(
-            name_and_id
-        ) and not PAYMENT_TOGGLE_PATTERN.search(value_attr):
-            logger.debug(
-                "Skipping radio as payment candidate: name/id='%s', value='%s'",
-                name_and_id,
-                value_attr,
-            )
-            continue
-        if toggle and id(toggle) not in seen_handles:
-            seen_handles.add(id(toggle))
-            handles.append(toggle)
-
     options: List[PaymentOption] = []
     seen: Set[Tuple[str, str]] = set()
-    for handle in handles:
-        try:
-            data_value = (
-                handle.get_attribute("data-method")
-                or handle.get_attribute("data-payment")
-                or handle.get_attribute("data-pay")
-                or handle.get_attribute("data-gateway")
-                or handle.get_attribute("data-processor")
-                or handle.get_attribute("data-coin")
-                or handle.get_attribute("value")
-                or ""
-            ).strip()
-        except PlaywrightError:
-            data_value = ""
-        try:
-            label_text = (handle.inner_text() or handle.text_content() or "").strip()
-        except PlaywrightError:
-            label_text = ""
-        if not label_text:
-            try:
-                container = _locate_container_from_handle(handle, logger)
-                label_text = (container.inner_text() or "").strip()
-            except PlaywrightError:
-                label_text = ""
+    for descriptor, handle in zip(descriptors, handles):
+        if handle is None:
+            continue
+        data_value = str(descriptor.get("dataValue") or "")
+        label_text = str(descriptor.get("label") or "")
         value = data_value or label_text
         label = _normalize_option_label(label_text, data_value)
         if not (value or label):
@@ -1072,44 +1703,179 @@ def _extract_clickable_payment_options(
     return options
 
 
+def _array_elements(handle: JSHandle) -> List[Optional[ElementHandle]]:
+    """Element handles of a JS array handle, in index order."""
+    items = handle.get_properties()
+    return [
+        items[key].as_element()
+        for key in sorted((key for key in items if key.isdigit()), key=int)
+    ]
+
+
+# Detection results are reused while the page keeps the same document and
+# has not mutated since, so the cached element handles are still valid.
+DETECTION_CACHE_LIMIT = 32
+_DETECTION_CACHE: Dict[Tuple[str, str], Optional[DepositDetection]] = {}
+
+
+def _document_revision(page) -> Optional[str]:
+    try:
+        return _call_page_helper(page, "documentRevision")
+    except PlaywrightError:
+        return None
+
+
 def _find_deposit_form_with_payments(
     page, logger: logging.Logger
-) -> Optional[
-    Tuple[ElementHandle, Optional[ElementHandle], List[PaymentOption], ElementHandle]
-]:
+) -> Optional[DepositDetection]:
+    revision = _document_revision(page)
+    if revision is None:
+        return _detect_deposit_form(page, logger)
+    key = (page.url, revision)
+    if key in _DETECTION_CACHE:
+        logger.debug("Reusing deposit form detection for unchanged %s", page.url)
+        return _DETECTION_CACHE[key]
+    detection = _detect_deposit_form(page, logger)
+    if len(_DETECTION_CACHE) >= DETECTION_CACHE_LIMIT:
+        _DETECTION_CACHE.clear()
+    _DETECTION_CACHE[key] = detection
+    return detection
+
+
+def _detect_deposit_form(page, logger: logging.Logger) -> Optional[DepositDetection]:
+    found = _discover_deposit_form(page, logger)
+    if not found:
+        logger.debug("No deposit form with payment options detected on %s", page.url)
+        return None
     try:
-        forms = page.query_selector_all("form")
-    except PlaywrightError as exc:
-        logger.debug("Unable to enumerate forms on deposit page: %s", exc)
+        data = found["data"].json_value()
+        form = found["form"].as_element()
+        submit = found["submit"].as_element()
+        select = found["select"].as_element()
+        clickable_handles = _array_elements(found["clickables"])
+    except (KeyError, PlaywrightError) as exc:
+        logger.debug("Unable to resolve deposit form handles: %s", exc)
         return None
-    for form in forms:
-        if not _deposit_form_candidate(form, logger):
-            continue
-        submit = _find_submit_control(form, logger)
-        logger.debug(
-            "Deposit form candidate on %s: has_submit=%s",
-            page.url,
-            bool(submit),
+    logger.debug(
+        "Deposit form candidate %d on %s: has_submit=%s",
+        data["formIndex"],
+        page.url,
+        bool(submit),
+    )
+    if not form or not submit:
+        return None
+    select_info = data.get("select")
+    if select_info and select:
+        options = _select_options_from_discovery(select_info["options"])
+        logger.debug("Found %d select-based payment options", len(options))
+        return form, select, options, submit, _index_payment_options(options)
+    clickable_options = _clickable_options_from_discovery(
+        data.get("clickable") or [], clickable_handles
+    )
+    logger.debug("Found %d clickable payment options", len(clickable_options))
+    if clickable_options:
+        return (
+            form,
+            None,
+            clickable_options,
+            submit,
+            _index_payment_options(clickable_options),
         )
-        if not submit:
-            logger.debug(
-                "Skipping deposit form candidate without submit control on %s", page.url
-            )
-            continue
-        select = _find_payment_select(form, logger)
-        if select:
-            options = _extract_payment_options(select, logger)
-            logger.debug("Found %d select-based payment options", len(options))
-            if options:
-                return form, select, options, submit
-        clickable_options = _extract_clickable_payment_options(form, logger)
-        logger.debug("Found %d clickable payment options", len(clickable_options))
-        if clickable_options:
-            return form, None, clickable_options, submit
-    logger.debug("No deposit form with payment options detected on %s", page.url)
     return None
 
 
+_SELECT_OPTION_BY_INDEX_JS = """
+(el, idx) => {
+    const opt = el.options[idx];
+    if (!opt) {
+        return false;
+    }
+    el.value = opt.value;
+    el.dispatchEvent(new Event('change', { bubbles: true }));
+    return true;
+}
+"""
+
+_SELECT_OPTION_BY_TARGET_JS = """
+(el, target) => {
+    const match = [...el.options].find(
+        opt =>
+            (target.value && opt.value === target.value) ||
+            (target.label && opt.textContent.trim() === target.label)
+    );
+    if (!match) {
+        return false;
+    }
+    el.value = match.value;
+    el.dispatchEvent(new Event('change', { bubbles: true }));
+    return true;
+}
+"""
+
+_SET_INPUT_VALUE_JS = """
+(el, value) => {
+    el.value = value;
+    el.dispatchEvent(new Event('input', { bubbles: true }));
+}
+"""
+
+
+def _call_page_helper(target, name: str, *args):
+    """Call a window.__asHelpers function on a page or element handle.
+
+    Documents loaded before the init script was registered get the helpers
+    installed on first use. PlaywrightError propagates to the caller.
+    """
+    script = (
+        _ELEMENT_HELPER_CALL_JS
+        if isinstance(target, ElementHandle)
+        else _PAGE_HELPER_CALL_JS
+    )
+    call = {"name": name, "args": list(args)}
+    result = target.evaluate(script, call)
+    if result is None:
+        target.evaluate(_INSTALL_PAGE_HELPERS_JS)
+        result = target.evaluate(script, call)
+    return (result or {}).get("value")
+
+
+def _call_element_helper(target, name: str, *args) -> Optional[ElementHandle]:
+    """Like _call_page_helper, for helpers that return an element or null.
+
+    The element comes back as a handle, so it cannot be wrapped to tell a
+    null result from missing helpers; that is only checked on a null result.
+    """
+    script = (
+        _ELEMENT_HELPER_HANDLE_JS
+        if isinstance(target, ElementHandle)
+        else _PAGE_HELPER_HANDLE_JS
+    )
+    call = {"name": name, "args": list(args)}
+    element = target.evaluate_handle(script, call).as_element()
+    if element is None and not target.evaluate(_HELPERS_INSTALLED_JS):
+        target.evaluate(_INSTALL_PAGE_HELPERS_JS)
+        element = target.evaluate_handle(script, call).as_element()
+    return element
+
+
+def _call_handle_helper(target, name: str, *args) -> Dict[str, JSHandle]:
+    """Like _call_page_helper, for helpers returning an object holding elements.
+
+    Returns the object's properties as handles; empty for a null result.
+    """
+    script = (
+        _ELEMENT_HELPER_HANDLE_JS
+        if isinstance(target, ElementHandle)
+        else _PAGE_HELPER_HANDLE_JS
+    )
+    call = {"name": name, "args": list(args)}
+    properties = target.evaluate_handle(script, call).get_properties()
+    if not properties and not target.evaluate(_HELPERS_INSTALLED_JS):
+        target.evaluate(_INSTALL_PAGE_HELPERS_JS)
+        properties = target.evaluate_handle(script, call).get_properties()
+    return properties
+
+
 def _select_payment_option(
     page,
     select: Optional[ElementHandle],
@@ -1117,11 +1883,9 @@ def _select_payment_option(
     logger: logging.Logger,
 ) -> bool:
     if option.handle:
+        before = mutation_count(page)
         if _safe_click_handle(option.handle, logger):
-            try:
-                page.wait_for_timeout(300)
-            except PlaywrightError:
-                pass
+            _wait_for_mutation(page, before, 600)
             return True
         return False
     if not select:
@@ -1134,61 +1898,54 @@ def _select_payment_option(
         return True
     except PlaywrightError as exc:
         logger.debug("select_option failed for '%s': %s", target, exc)
+    if option.dom_index is not None:
+        try:
+            return bool(
+                _call_page_helper(select, "selectOptionByIndex", option.dom_index)
+            )
+        except PlaywrightError as exc:
+            logger.debug("Indexed selection failed for '%s': %s", target, exc)
     try:
-        success = bool(
-            select.evaluate(
-                """
-                (el, target) => {
-                    const match = [...el.options].find(
-                        opt =>
-                            (target.value && opt.value === target.value) ||
-                            (target.label && opt.textContent.trim() === target.label)
-                    );
-                    if (!match) {
-                        return false;
-                    }
-                    el.value = match.value;
-                    el.dispatchEvent(new Event('change', { bubbles: true }));
-                    return true;
-                }
-                """,
+        return bool(
+            _call_page_helper(
+                select,
+                "selectOptionByTarget",
                 {"value": option.value, "label": option.label},
             )
         )
-        return success
     except PlaywrightError as exc:
         logger.debug("Fallback selection failed for '%s': %s", target, exc)
     return False
 
 
-def _fill_deposit_amount(
-    form: ElementHandle, logger: logging.Logger, amount: str = "1000"
-) -> bool:
-    selectors = (
+# Like the hidden-payment lookup below, amount candidates are one selector
+# list so the browser does a single traversal; hidden inputs are excluded in
+# the selector itself instead of with a follow-up attribute read.
+DEPOSIT_AMOUNT_SELECTOR = ", ".join(
+    f"{selector}:not([type='hidden' i])"
+    for selector in (
         "input[name*='amount' i]",
         "input[id*='amount' i]",
         "input[name*='sum' i]",
         "input[type='number']",
     )
-    for selector in selectors:
-        try:
-            field = form.query_selector(selector)
-        except PlaywrightError as exc:
-            logger.debug("Amount input lookup failed for '%s': %s", selector, exc)
-            continue
-        if not field:
-            continue
-        try:
-            field_type = (field.get_attribute("type") or "").lower()
-        except PlaywrightError:
-            field_type = ""
-        if field_type == "hidden":
-            continue
+)
+
+
+def _fill_deposit_amount(
+    form: ElementHandle, logger: logging.Logger, amount: str = "1000"
+) -> bool:
+    try:
+        field = form.query_selector(DEPOSIT_AMOUNT_SELECTOR)
+    except PlaywrightError as exc:
+        logger.debug("Amount input lookup failed: %s", exc)
+        field = None
+    if field:
         try:
             field.fill(amount)
             return True
         except PlaywrightError as exc:
-            logger.debug("Unable to fill amount via '%s': %s", selector, exc)
+            logger.debug("Unable to fill amount input: %s", exc)
     logger.debug("No amount input filled on deposit form; continuing without it")
     return False
 
@@ -1223,34 +1980,33 @@ def _ensure_payment_hidden_value(
     except PlaywrightError:
         pass
     try:
-        hidden.evaluate(
-            "(el, value) => { el.value = value; el.dispatchEvent(new Event('input', { bubbles: true })); }",
-            target_value,
-        )
+        _call_page_helper(hidden, "setInputValue", target_value)
     except PlaywrightError as exc:
         logger.debug("Unable to set hidden payment input: %s", exc)
 
 
 def _match_payment_option(
-    target: PaymentOption, options: List[PaymentOption]
+    target: PaymentOption,
+    options: List[PaymentOption],
+    options_by_key: Dict[PaymentOptionKey, PaymentOption],
 ) -> Optional[PaymentOption]:
-    desired = (
-        (target.value or "").strip().lower(),
-        (target.label or "").strip().lower(),
-    )
-    for option in options:
-        candidate = (
-            (option.value or "").strip().lower(),
-            (option.label or "").strip().lower(),
-        )
-        if candidate == desired:
-            return option
+    match = options_by_key.get(target.key)
+    if match:
+        return match
     if options:
         return options[0]
     return None
 
 
-def _submit_deposit_form(page, form: ElementHandle, logger: logging.Logger) -> None:
+class SubmitOutcome(str, Enum):
+    NAVIGATED = "navigated"
+    IN_PLACE = "in_place"
+    FAILED = "failed"
+
+
+def _submit_deposit_form(
+    page, form: ElementHandle, logger: logging.Logger
+) -> SubmitOutcome:
     submit = _find_submit_control(form, logger)
 
     def _perform_submit() -> None:
@@ -1261,33 +2017,62 @@ def _submit_deposit_form(page, form: ElementHandle, logger: logging.Logger) -> N
     try:
         with page.expect_navigation(wait_until="load", timeout=12000):
             _perform_submit()
-        return
+        return SubmitOutcome.NAVIGATED
     except PlaywrightTimeoutError:
         logger.debug(
             "Deposit form submission did not complete 'load' navigation in time"
         )
     except PlaywrightError as exc:
         logger.warning("Failed to submit deposit form: %s", exc)
-        return
+        return SubmitOutcome.FAILED
     try:
         with page.expect_navigation(wait_until="domcontentloaded", timeout=12000):
             _perform_submit()
-        return
+        return SubmitOutcome.NAVIGATED
     except PlaywrightTimeoutError:
         logger.debug(
             "Deposit form submission did not reach DOMContentLoaded navigation in time"
         )
     except PlaywrightError as exc:
         logger.warning("Fallback deposit form submission failed: %s", exc)
-        return
+        return SubmitOutcome.FAILED
     try:
         page.wait_for_load_state("domcontentloaded", timeout=6000)
     except PlaywrightTimeoutError:
         logger.debug("DOMContentLoaded wait after submit timed out; continuing")
-        try:
-            page.wait_for_timeout(800)
-        except PlaywrightError:
-            pass
+    return SubmitOutcome.IN_PLACE
+
+
+# Besides form.reset(), clear typed-in values that scripts may have written
+# into value properties; hidden fields and option-bearing inputs keep theirs.
+_RESET_DEPOSIT_FORM_JS = """
+(form) => {
+    form.reset();
+    const keep = new Set([
+        'hidden',
+        'radio',
+        'checkbox',
+        'submit',
+        'button',
+        'image',
+        'file',
+    ]);
+    for (const input of form.querySelectorAll('input')) {
+        if (!keep.has(input.type)) {
+            input.value = '';
+        }
+    }
+}
+"""
+
+
+def _reset_deposit_form(form: Optional[ElementHandle], logger: logging.Logger) -> None:
+    if not form:
+        return
+    try:
+        _call_page_helper(form, "resetForm")
+    except PlaywrightError as exc:
+        logger.debug("Unable to reset deposit form in place: %s", exc)
 
 
 def explore_deposit_form(
@@ -1301,7 +2086,7 @@ def explore_deposit_form(
     detection = _find_deposit_form_with_payments(page, logger)
     if not detection:
         return [], []
-    _, _, options, _ = detection
+    _, _, options, _, _ = detection
     payment_options = options[:max_payment_options]
     if not payment_options:
         logger.debug("Deposit form detected but no selectable payment options found")
@@ -1316,18 +2101,25 @@ def explore_deposit_form(
         len(payment_options),
         max_payment_options,
     )
+    # Only reload the deposit page when the previous submit navigated away or
+    # failed; after an in-place submit reset the form and reuse the page.
+    needs_reload = False
     for idx, option in enumerate(payment_options):
-        try:
-            page.goto(deposit_url, wait_until="load")
-        except PlaywrightError as exc:
-            logger.warning(
-                "Failed to load deposit page before option '%s': %s",
-                option.label or option.value or f"option-{idx + 1}",
-                exc,
-            )
-            break
-
-        detection = _find_deposit_form_with_payments(page, logger)
+        if needs_reload:
+            try:
+                page.goto(deposit_url, wait_until="domcontentloaded")
+                _wait_for_load_grace(page, logger)
+            except PlaywrightError as exc:
+                logger.warning(
+                    "Failed to load deposit page before option '%s': %s",
+                    option.label or option.value or f"option-{idx + 1}",
+                    exc,
+                )
+                break
+            detection = _find_deposit_form_with_payments(page, logger)
+        elif idx > 0:
+            _reset_deposit_form(detection[0] if detection else None, logger)
+            detection = _find_deposit_form_with_payments(page, logger)
         if not detection:
             logger.debug(
                 "Deposit form missing when processing option %d; retrying reload",
@@ -1346,8 +2138,8 @@ def explore_deposit_form(
         if not detection:
             logger.debug("Deposit form still missing after reload (option %d)", idx + 1)
             break
-        form, select, current_options, _ = detection
-        target_option = _match_payment_option(option, current_options)
+        form, select, current_options, _, options_by_key = detection
+        target_option = _match_payment_option(option, current_options, options_by_key)
         if not target_option:
             logger.debug(
                 "Unable to find payment option to match '%s'; skipping", option.label
@@ -1361,9 +2153,10 @@ def explore_deposit_form(
             )
             continue
         _ensure_payment_hidden_value(form, target_option, logger)
-        _submit_deposit_form(page, form, logger)
+        outcome = _submit_deposit_form(page, form, logger)
+        needs_reload = outcome is not SubmitOutcome.IN_PLACE or page.url != deposit_url
         try:
-            page.wait_for_timeout(800)
+            page.wait_for_load_state("domcontentloaded", timeout=800)
         except PlaywrightError:
             pass
         label = (
@@ -1395,15 +2188,31 @@ def click_deposit_methods(
     indicators: List[Indicator] = []
     page = browser.page
     clicks = 0
-    seen_crypto = _scan_crypto_fingerprint(page, logger)
-    for keyword in DEPOSIT_METHOD_KEYWORDS:
+    keyword_hits = _scan_keyword_nodes(page, DEPOSIT_METHOD_KEYWORDS, logger)
+    if keyword_hits is not None and not any(keyword_hits.values()):
+        logger.debug(
+            "No deposit method keywords on %s; skipping method clicks", page.url
+        )
+        return artifacts, indicators
+    # Only keywords the pre-scan found are tried; without a pre-scan every
+    # keyword falls back to a live text query.
+    present_keywords = [
+        keyword
+        for keyword in DEPOSIT_METHOD_KEYWORDS
+        if keyword_hits is None or keyword_hits.get(keyword)
+    ]
+    _track_dom_changes(page, logger)
+    seen_crypto = _scan_fingerprint(page, logger)
+    for keyword in present_keywords:
         if clicks >= max_clicks:
             break
         # logger.debug("Searching for deposit method keyword '%s'", keyword)
         for occurrence in range(2):
             if clicks >= max_clicks:
                 break
-            container = _find_keyword_container(page, keyword, occurrence, logger)
+            container = _find_keyword_container(
+                page, keyword, occurrence, logger, keyword_hits
+            )
             if not container:
                 # if occurrence == 0:
                 #     logger.debug("Keyword '%s' not found on current view", keyword)
@@ -1417,6 +2226,7 @@ def click_deposit_methods(
                         keyword,
                     )
                     continue
+            before_click = mutation_count(page)
             if not _safe_click_handle(action_target, logger):
                 logger.debug(
                     "Unable to click action target for keyword '%s' (occurrence %d)",
@@ -1428,9 +2238,9 @@ def click_deposit_methods(
             logger.debug(
                 "Triggered deposit option for '%s' (interaction %d)", keyword, clicks
             )
-            _wait_for_modal_state(page, logger)
-            post_crypto = _scan_crypto_fingerprint(page, logger)
-            new_crypto = post_crypto - seen_crypto
+            _wait_for_dom_settled(page, before_click, logger)
+            post_crypto = _scan_delta_fingerprint(page, logger)
+            new_crypto = [item for item in post_crypto if item not in seen_crypto]
             if new_crypto:
                 label = f"{base_label}_method_{clicks:02d}_{sanitize_filename(keyword)}"
                 view_artifacts, view_indicators = capture_page_state(
@@ -1449,8 +2259,9 @@ def click_deposit_methods(
                     keyword,
                 )
             seen_crypto |= post_crypto
-            _dismiss_modal(page, logger)
-            page.wait_for_timeout(400)
+            before_dismiss = mutation_count(page)
+            if _dismiss_modal(page, logger):
+                _wait_for_mutation(page, before_dismiss, 400)
             break
     return artifacts, indicators
 
@@ -1486,6 +2297,9 @@ def scan_current_view(
             label,
             exc,
         )
+    if not page_mentions(browser.page, REVEAL_KEYWORDS, logger):
+        logger.debug("No reveal keywords on '%s'; skipping reveal clicks", label)
+        return artifacts, indicators
     try:
         reveal_artifacts, reveal_indicators = reveal_hidden_sections(
             browser, run_paths, label, logger
@@ -1502,34 +2316,154 @@ def scan_current_view(
 
 
 def click_menu(page, *, logger: logging.Logger) -> bool:
-    for keyword in MENU_KEYWORDS:
-        logger.debug("Attempting to open navigation via keyword '%s'", keyword)
-        if click_by_text(page, keyword, logger=logger):
+    present = mentioned_keywords(page, MENU_KEYWORDS, logger)
+    keywords = tuple(
+        keyword for keyword in MENU_KEYWORDS if present is None or keyword in present
+    )
+    if keywords:
+        logger.debug("Attempting to open navigation via keywords %s", keywords)
+        keyword = click_by_pattern(
+            page, keyword_pattern(keywords), keywords, logger=logger
+        )
+        if keyword is not None:
+            logger.debug("Opened navigation via keyword '%s'", keyword)
             return True
     logger.debug("Navigation keywords did not open a menu")
     return False
 
 
+# The hint alternation is compiled once per call into a case-insensitive
+# RegExp, so each text is swept once instead of once per hint. Python's
+# re.escape output only uses identity escapes, which JS accepts without 'u'.
+_DEPOSIT_CONTEXT_JS = """
+(pattern) => {
+    const hintRe = new RegExp(pattern, 'i');
+    const matches = (text) => hintRe.test(text || '');
+    const headings = document.querySelectorAll("h1, h2, .page-title, [role='heading']");
+    for (let idx = 0; idx < Math.min(3, headings.length); idx += 1) {
+        if (matches(headings[idx].innerText)) {
+            return true;
+        }
+    }
+    if (!document.body) {
+        return false;
+    }
+    // Stop at the first rendered text node that matches instead of
+    // materialising innerText for the whole body.
+    const skipped = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE']);
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+        const parent = node.parentElement;
+        if (!parent || skipped.has(parent.tagName) || !matches(node.data)) {
+            continue;
+        }
+        const rendered = parent.checkVisibility
+            ? parent.checkVisibility()
+            : parent.getClientRects().length > 0;
+        if (rendered) {
+            return true;
+        }
+    }
+    return false;
+}
+"""
+
+
 def is_deposit_context(page) -> bool:
-    url_lower = page.url.lower()
-    if any(hint in url_lower for hint in DEPOSIT_CONTEXT_HINTS):
+    if _DEPOSIT_CONTEXT_RE.search(page.url):
         return True
+    # Headings and body are checked in the page so only a boolean crosses CDP.
     try:
-        headings = page.locator("h1, h2, .page-title, [role='heading']")
-        count = min(3, headings.count())
-        for idx in range(count):
-            try:
-                text = headings.nth(idx).inner_text(timeout=500).strip().lower()
-            except PlaywrightError:
-                continue
-            if any(hint in text for hint in DEPOSIT_CONTEXT_HINTS):
-                return True
-    except PlaywrightError:
-        pass
-    try:
-        body_snippet = page.inner_text("body", timeout=800).lower()
-        if any(hint in body_snippet for hint in DEPOSIT_CONTEXT_HINTS):
-            return True
+        return bool(
+            _call_page_helper(page, "isDepositContext", _DEPOSIT_CONTEXT_RE.pattern)
+        )
     except PlaywrightError:
         return False
-    return False
+
+
+# Reports which keywords occur anywhere in the body text or an accessible
+# name. Hidden text counts, since reveal targets are often collapsed, and
+# icon-only buttons only carry their label in attributes.
+_MENTIONED_KEYWORDS_JS = """
+(keywords) => {
+    if (!document.body) {
+        return [];
+    }
+    const labelled = document.body.querySelectorAll(
+        '[aria-label], [title], input[type=button], input[type=submit]'
+    );
+    const names = [...labelled].map(
+        (el) => el.getAttribute('aria-label') || el.title || el.value || ''
+    );
+    const haystack = [document.body.textContent || '', ...names]
+        .join('\\n')
+        .toLowerCase();
+    return keywords.filter((keyword) => haystack.includes(keyword.toLowerCase()));
+}
+"""
+
+
+def mentioned_keywords(
+    page, keywords: Iterable[str], logger: logging.Logger
+) -> Optional[Set[str]]:
+    """Return the keywords present on the page, or None if the check failed."""
+    try:
+        found = _call_page_helper(page, "mentionedKeywords", list(keywords))
+    except PlaywrightError as exc:
+        logger.debug("Keyword presence check failed: %s", exc)
+        return None
+    return set(found or [])
+
+
+def page_mentions(page, keywords: Iterable[str], logger: logging.Logger) -> bool:
+    # A failed check must not suppress the clicks it guards.
+    found = mentioned_keywords(page, keywords, logger)
+    return found is None or bool(found)
+
+
+# Every synchronous page function above is installed once per context as
+# window.__asHelpers, so each call only ships a short dispatcher plus the
+# helper name and arguments. Promise-returning scripts stay inline because
+# the dispatcher wraps the return value; element-returning helpers go
+# through _call_element_helper. Assembled last so all helper sources are
+# defined.
+PAGE_HELPERS_SCRIPT = f"""
+window.__asHelpers = {{
+    discoverDepositForm: {_DEPOSIT_FORM_DISCOVERY_JS.strip()},
+    selectOptionByIndex: {_SELECT_OPTION_BY_INDEX_JS.strip()},
+    selectOptionByTarget: {_SELECT_OPTION_BY_TARGET_JS.strip()},
+    setInputValue: {_SET_INPUT_VALUE_JS.strip()},
+    trackMutations: {_TRACK_MUTATIONS_JS.strip()},
+    drainMutations: {_DRAIN_MUTATIONS_JS.strip()},
+    documentRevision: {DOCUMENT_REVISION_JS.strip()},
+    scanKeywordNodes: {_KEYWORD_NODE_SCAN_JS.strip()},
+    resetForm: {_RESET_DEPOSIT_FORM_JS.strip()},
+    isDepositContext: {_DEPOSIT_CONTEXT_JS.strip()},
+    mentionedKeywords: {_MENTIONED_KEYWORDS_JS.strip()},
+    containerSelectors: {json.dumps(list(POTENTIAL_CONTAINER_SELECTORS))},
+    containerOf: {_CONTAINER_OF_JS.strip()},
+    keywordContainer: {_KEYWORD_CONTAINER_JS.strip()},
+    copyNeighborText: {_COPY_NEIGHBOR_JS.strip()},
+    inputValues: {_INPUT_VALUES_JS.strip()},
+}};
+"""
+_INSTALL_PAGE_HELPERS_JS = f"() => {{ {PAGE_HELPERS_SCRIPT} }}"
+_PAGE_HELPER_CALL_JS = """
+(call) => window.__asHelpers
+    ? { value: window.__asHelpers[call.name](...call.args) }
+    : null
+"""
+_ELEMENT_HELPER_CALL_JS = """
+(el, call) => window.__asHelpers
+    ? { value: window.__asHelpers[call.name](el, ...call.args) }
+    : null
+"""
+_PAGE_HELPER_HANDLE_JS = """
+(call) => window.__asHelpers ? window.__asHelpers[call.name](...call.args) : null
+"""
+_ELEMENT_HELPER_HANDLE_JS = """
+(el, call) => window.__asHelpers
+    ? window.__asHelpers[call.name](el, ...call.args)
+    : null
+"""
+_HELPERS_INSTALLED_JS = "() => Boolean(window.__asHelpers)"
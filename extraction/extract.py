@@ -5,7 +5,12 @@ from __future__ import annotations
 from typing import Dict
 
 from .archival_crawler import MappingInputs, MappingResult, run_mapping
-from .deepdive_strategist import ProbeInputs, ProbeResult, run_targeted_probe
+from .deepdive_strategist import (
+    ProbeInputs,
+    ProbeResult,
+    run_targeted_probe,
+    warm_browser,
+)
 
 # Backwards compatibility with the previous CLI/API naming.
 ExtractInputs = ProbeInputs
@@ -28,4 +33,5 @@ __all__ = [
     "run_mapping",
     "run_extraction",
     "run_targeted_probe",
+    "warm_browser",
 ]
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 import json
 import re
 import secrets
@@ -12,6 +13,10 @@ from typing import Any
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT_DIR / "data"
+# Large DOM dumps are written in slices so the UTF-8 encoding never needs a
+# second full-size buffer alongside the source string.
+WRITE_CHUNK_CHARS = 1 << 20
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
 
 
 @dataclass(slots=True)
@@ -59,17 +64,28 @@ def write_json(path: Path, payload: Any) -> Path:
 
 def save_text(path: Path, content: str) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    with path.open("w", encoding="utf-8") as handle:
+        for start in range(0, len(content), WRITE_CHUNK_CHARS):
+            handle.write(content[start : start + WRITE_CHUNK_CHARS])
     return path
 
 
+# Labels are built from a small, fixed set of keywords and step names.
+@lru_cache(maxsize=256)
 def sanitize_filename(text: str) -> str:
-    cleaned = re.sub(r"[^A-Za-z0-9._-]+", "-", text.strip()) or "artifact"
+    cleaned = _UNSAFE_FILENAME_RE.sub("-", text.strip()) or "artifact"
     cleaned = cleaned.strip("-_")
     return cleaned or "artifact"
 
 
 def relative_artifact_path(path: Path) -> str:
+    # Run paths are built under the already-resolved ROOT_DIR, so the common
+    # case needs no filesystem lookups from resolve().
+    if path.is_absolute():
+        try:
+            return str(path.relative_to(ROOT_DIR))
+        except ValueError:
+            pass
     try:
         return str(path.resolve().relative_to(ROOT_DIR))
     except ValueError:
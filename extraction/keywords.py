@@ -0,0 +1,24 @@
+"""Shared keyword alternations and URL hint patterns."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+LOGIN_PATH_HINTS = ("login", "signin", "sign-in", "sign_in")
+
+
+@lru_cache(maxsize=64)
+def _compile_keywords(keywords: Tuple[str, ...]) -> re.Pattern[str]:
+    # An empty keyword list must match nothing rather than everything.
+    alternation = "|".join(re.escape(keyword) for keyword in keywords if keyword)
+    return re.compile(alternation or "(?!)", re.IGNORECASE)
+
+
+def keyword_pattern(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Compile literal keywords into one case-insensitive alternation."""
+    return _compile_keywords(tuple(keywords))
+
+
+LOGIN_PATH_RE = keyword_pattern(LOGIN_PATH_HINTS)
@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 import logging
-import re
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from urllib.parse import urlparse
 
 from playwright.sync_api import Error as PlaywrightError
@@ -16,16 +15,20 @@ from .automation import (
     AUTH_KEYWORDS,
     EMAIL_SELECTORS,
     SECRET_SELECTORS,
+    FormDefinition,
     detect_error_banner,
     fill_form_fields,
     find_form,
     submit_form,
 )
+from .browser import document_revision
 from .io_utils import RunPaths, relative_artifact_path, save_text
+from .keywords import LOGIN_PATH_RE, keyword_pattern
 from .page_utils import wait_for_page_ready
 
 LOGGED_IN_HINTS = ("logout", "log out", "dashboard", "my account", "profile", "cabinet")
-LOGIN_PATH_HINTS = ("login", "signin", "sign-in", "sign_in")
+# One alternation so a single locator query covers every logged-in hint.
+LOGGED_IN_HINT_RE = keyword_pattern(LOGGED_IN_HINTS)
 
 
 @dataclass(slots=True)
@@ -35,15 +38,30 @@ class LoginResult:
     notes: List[str]
 
 
+# The last login form lookup and the (url, document revision) it ran at;
+# navigation and submit retries probe the same unchanged page repeatedly.
+_LAST_LOGIN_FORM: Optional[Tuple[Tuple[str, str], Optional[FormDefinition]]] = None
+
+
 def get_login_form(page, *, logger: logging.Logger | None = None):
-    return find_form(
+    global _LAST_LOGIN_FORM
+    revision = document_revision(page)
+    key = (page.url, revision) if revision else None
+    if key and _LAST_LOGIN_FORM and _LAST_LOGIN_FORM[0] == key:
+        return _LAST_LOGIN_FORM[1]
+    form = find_form(
         page,
         {"email": EMAIL_SELECTORS, "secret": SECRET_SELECTORS},
         logger=logger,
     )
+    _LAST_LOGIN_FORM = (key, form) if key else None
+    return form
 
 
-def navigate_to_login(page, *, logger: logging.Logger, max_clicks: int = 5) -> None:
+def navigate_to_login(
+    page, *, logger: logging.Logger, max_clicks: int = 5
+) -> Optional[FormDefinition]:
+    """Click through auth links until a login form shows; return that form."""
     config = NavigationConfig(
         primary_keywords=AUTH_KEYWORDS,
         secondary_keywords=("register", "sign up", "signup", "create account"),
@@ -53,7 +71,7 @@ def navigate_to_login(page, *, logger: logging.Logger, max_clicks: int = 5) -> N
         fallback_keywords=AUTH_KEYWORDS,
         fallback_clicks=max_clicks,
     )
-    discover_form_with_navigation(
+    form, _ = discover_form_with_navigation(
         page,
         detect_form=lambda current_page: (
             get_login_form(current_page, logger=logger),
@@ -63,6 +81,7 @@ def navigate_to_login(page, *, logger: logging.Logger, max_clicks: int = 5) -> N
         config=config,
         logger=logger,
     )
+    return form
 
 
 def infer_login_success(
@@ -78,28 +97,27 @@ def infer_login_success(
         log.info("Error banner present after login attempt: %s", error_text)
         return False
 
-    prev = urlparse(previous_url)
-    curr = urlparse(page.url)
-    prev_host = (prev.hostname or "").lower().lstrip("www.")
-    curr_host = (curr.hostname or "").lower().lstrip("www.")
-    same_path = prev.path == curr.path
-    same_query = prev.query == curr.query
-    same_host = prev_host == curr_host
+    current_url = page.url
+    curr = urlparse(current_url)
     curr_path = curr.path or ""
+    on_login_path = is_login_path(curr_path)
 
-    if is_login_path(curr_path) and login_form_present:
+    if on_login_path and login_form_present:
         log.debug("Still on login path '%s' with login form visible", curr_path)
         return False
 
-    if not is_login_path(curr_path):
-        for keyword in LOGGED_IN_HINTS:
-            locator = page.get_by_text(re.compile(keyword, re.IGNORECASE))
-            if locator.count() > 0:
-                log.debug("Detected logged-in hint '%s' on page", keyword)
-                return True
-        if not (same_path and same_host and same_query):
+    if not on_login_path:
+        if page.get_by_text(LOGGED_IN_HINT_RE).count() > 0:
+            log.debug("Detected logged-in hint on page")
+            return True
+        # Only compare against the pre-submit URL once the cheaper signals
+        # are inconclusive.
+        prev = urlparse(previous_url)
+        prev_host = (prev.hostname or "").lower().removeprefix("www.")
+        curr_host = (curr.hostname or "").lower().removeprefix("www.")
+        if (prev.path, prev.query, prev_host) != (curr.path, curr.query, curr_host):
             log.debug(
-                "URL changed after login submit (%s -> %s)", previous_url, page.url
+                "URL changed after login submit (%s -> %s)", previous_url, current_url
             )
             return True
     else:
@@ -209,8 +227,7 @@ def _capture_login_debug(
 
 
 def is_login_path(path: str) -> bool:
-    normalized = (path or "").lower()
-    return any(hint in normalized for hint in LOGIN_PATH_HINTS)
+    return bool(path) and LOGIN_PATH_RE.search(path) is not None
 
 
 def perform_login(
@@ -226,8 +243,7 @@ def perform_login(
     form = get_login_form(page, logger=logger)
     if not form:
         logger.debug("Login form not found, attempting auth navigation")
-        navigate_to_login(page, logger=logger)
-        form = get_login_form(page, logger=logger)
+        form = navigate_to_login(page, logger=logger)
 
     if not form:
         notes.append("Could not locate a login form with email + secret fields.")
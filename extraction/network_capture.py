@@ -5,10 +5,12 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from playwright.sync_api import Page
 
+from .keywords import keyword_pattern
+
 DEFAULT_KEYWORDS = (
     "register",
     "signup",
@@ -27,6 +29,15 @@ class NetworkRecord:
     resource_type: str
     body: Optional[str]
 
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "url": self.url,
+            "status": self.status,
+            "method": self.method,
+            "resource_type": self.resource_type,
+            "body": self.body,
+        }
+
 
 @dataclass
 class NetworkCapture:
@@ -39,9 +50,11 @@ class NetworkCapture:
         self._handler = None
 
     def __enter__(self) -> "NetworkCapture":
+        # Every response passes through the handler; match all keywords at once.
+        keyword_re = keyword_pattern(self.keywords)
+
         def handler(response):
-            url_lower = response.url.lower()
-            if not any(keyword in url_lower for keyword in self.keywords):
+            if not keyword_re.search(response.url):
                 return
             try:
                 body = response.text()
@@ -85,9 +98,7 @@ class NetworkCapture:
     def dump(self, path: Path) -> Optional[Path]:
         if not self.records:
             return None
-        from dataclasses import asdict
-
-        payload = [asdict(record) for record in self.records]
+        payload = [record.to_dict() for record in self.records]
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
         return path
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
-from .data_extractor import extract_from_html, iter_crypto_strings
+from .data_extractor import contains_crypto_string, extract_from_html
 
 
 @dataclass(slots=True)
@@ -16,6 +16,15 @@ class Indicator:
     context: str
     artifact: str | None = None
 
+    def to_dict(self) -> Dict[str, str | None]:
+        return {
+            "type": self.type,
+            "value": self.value,
+            "source_url": self.source_url,
+            "context": self.context,
+            "artifact": self.artifact,
+        }
+
 
 def extract_indicators(
     raw_html: str,
@@ -49,4 +58,4 @@ def _deduplicate(indicators: Iterable[Indicator]) -> List[Indicator]:
 
 
 def has_crypto_match(text: str) -> bool:
-    return any(iter_crypto_strings(text))
+    return contains_crypto_string(text)